@@ -24,9 +24,11 @@ class ExtendedEnum(Enum):
         if type(object) == cls:
             return object
         if type(object) == str:
-            for enum in cls:
-                if object.upper() == enum.value:
-                    return enum
+            # Enum value lookup is a dictionary hit rather than a scan of the members.
+            try:
+                return cls(object.upper())
+            except ValueError:
+                pass
             valid_values = ", ".join(cls.list())
             raise AttributeError(f"{cls.__name__} must be one of {valid_values}")
 
@@ -61,6 +63,13 @@ OMICS_URI_TYPE_FILENAME_MAP = {
 }
 
 
+# The valid file name values for each file type, for constant-time membership checks.
+OMICS_URI_TYPE_FILENAME_SET = {
+    file_type: frozenset(file_names.list())
+    for file_type, file_names in OMICS_URI_TYPE_FILENAME_MAP.items()
+}
+
+
 OMICS_URI_TYPE_DEFAULT_FILENAME_MAP = {
     OmicsFileType.READSET: ReadSetFileName.SOURCE1,
     OmicsFileType.REFERENCE: ReferenceFileName.SOURCE,
@@ -1,4 +1,5 @@
-from typing import IO, Any, Dict, List, Optional, Union
+import threading
+from typing import IO, Any, Callable, Dict, List, Optional, Union
 
 from s3transfer.futures import TransferFuture
 from s3transfer.subscribers import BaseSubscriber
@@ -13,10 +14,42 @@ class OmicsTransferSubscriber(BaseSubscriber):
 class OmicsTransferFuture(TransferFuture):
     """Future for getting the result of Omics data transfer."""
 
+    def add_done_callback(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Add a callback to be invoked once when the transfer is done.
+
+        If the transfer is already done, the callback is invoked immediately.
+        """
+        lock = threading.Lock()
+        called = False
+
+        def callback() -> None:
+            nonlocal called
+            with lock:
+                if called:
+                    return
+                called = True
+            function(*args, **kwargs)
+
+        self._coordinator.add_done_callback(callback)
+        # The coordinator drops callbacks added after it has run them, and may or may
+        # not have run this one yet, so run it here too; it only takes effect once.
+        if self.done():
+            callback()
+
 
 class FileDownload:
     """Details of an Omics file download."""
 
+    # One of these is created per transfer, so avoid a per-instance __dict__.
+    __slots__ = (
+        "omics_file_type",
+        "store_id",
+        "file_set_id",
+        "filename",
+        "fileobj",
+        "subscribers",
+    )
+
     def __init__(
         self,
         store_id: str,
@@ -24,7 +57,7 @@ class FileDownload:
         filename: str,
         fileobj: Union[IO[Any], str],
         omics_file_type: OmicsFileType,
-        subscribers: List[BaseSubscriber] = None,
+        subscribers: Optional[List[BaseSubscriber]] = None,
     ):
         """Details of a file download.
 
@@ -57,6 +90,20 @@ class FileDownload:
 class ReadSetUpload:
     """Details of an Omics read set upload."""
 
+    __slots__ = (
+        "store_id",
+        "file_type",
+        "name",
+        "subject_id",
+        "sample_id",
+        "reference_arn",
+        "fileobj",
+        "generated_from",
+        "description",
+        "tags",
+        "subscribers",
+    )
+
     def __init__(
         self,
         store_id: str,
@@ -1,4 +1,12 @@
-from s3transfer.constants import KB
+from typing import Optional
+
+from s3transfer.constants import KB, MB
+
+# Options that may be zero, such as delays where zero disables waiting.
+NON_NEGATIVE_ATTRS = ("download_retry_base_delay", "download_retry_max_delay")
+
+# Float options that must be greater than zero unless they are None.
+POSITIVE_FLOAT_ATTRS = ("metadata_cache_ttl",)
 
 
 class TransferConfig:
@@ -11,11 +19,19 @@ class TransferConfig:
         max_request_concurrency: int = 10,
         max_submission_concurrency: int = 5,
         max_request_queue_size: int = 1000,
-        max_submission_queue_size: int = 1000,
-        max_io_queue_size: int = 1000,
+        max_submission_queue_size: Optional[int] = 1000,
+        max_io_queue_size: Optional[int] = 1000,
         io_chunksize: int = 256 * KB,
         num_download_attempts: int = 5,
         max_bandwidth: int = None,
+        multipart_chunksize: int = 100 * MB,
+        max_in_memory_upload_chunks: int = 10,
+        max_in_memory_download_chunks: int = 10,
+        download_retry_base_delay: float = 0.1,
+        download_retry_max_delay: float = 20.0,
+        metadata_cache_size: int = 1000,
+        metadata_cache_ttl: Optional[float] = 3600.0,
+        release_page_cache: bool = False,
     ):
         """Create a Transfer Manager configuration.
 
@@ -27,7 +43,10 @@ class TransferConfig:
             directory: Directory to write data to.
 
             max_request_concurrency: The maximum number of Omics API
-                transfer-related requests that can happen at a time.
+                transfer-related requests that can happen at a time. On
+                bandwidth-constrained connections, a value of 1 sends upload
+                parts one at a time so that parallel parts do not starve and
+                time out.
 
             max_submission_concurrency: The maximum number of threads
                 processing a call to a TransferManager method. Processing a
@@ -42,10 +61,14 @@ class TransferConfig:
 
             max_submission_queue_size: The maximum amount of
                 TransferManager method calls that can be queued at a time.
+                None means the queue is unbounded, so queuing a large batch of
+                downloads never blocks the caller.
 
             max_io_queue_size: The maximum amount of read parts that
                 can be queued to be written to disk per download. The default
-                size for each element in this queue is 8 KB.
+                size for each element in this queue is 8 KB. None means the
+                queue is unbounded, so downloads never wait on disk writes to
+                queue more data (at the cost of buffering it in memory).
 
             io_chunksize: The max size of each chunk in the io queue.
 
@@ -62,6 +85,45 @@ class TransferConfig:
             max_bandwidth: The maximum bandwidth that will be consumed
                 in uploading and downloading file content. The value is in terms of
                 bytes per second.
+
+            multipart_chunksize: The part size used when uploading a read set.
+                Larger parts mean fewer upload requests for large files. The size
+                is adjusted if needed to stay within the service part size and
+                part count limits.
+
+            max_in_memory_upload_chunks: The number of upload parts that can be
+                held in memory at a time. Parts of file objects (rather than file
+                names) are read into memory before being uploaded, so this bounds
+                the memory used to roughly
+                ``max_in_memory_upload_chunks * multipart_chunksize``.
+
+            max_in_memory_download_chunks: The number of parts that can be
+                downloaded ahead of the part currently being written when
+                downloading to a non-seekable stream. Parts are written to such
+                streams in order, so parts that arrive early are held in memory.
+
+            download_retry_base_delay: The base delay in seconds before retrying
+                a failed download stream. Retries wait a random time of up to
+                ``download_retry_base_delay * 2 ** attempt`` seconds ("full jitter")
+                so that many parts failing at once do not retry in lockstep.
+
+            download_retry_max_delay: The maximum delay in seconds before retrying
+                a failed download stream.
+
+            Both retry delays must be zero or greater; zero disables the back off.
+
+            metadata_cache_size: The maximum number of references and, separately,
+                read sets whose metadata is cached. The least recently used entry
+                is evicted when the cache is full.
+
+            metadata_cache_ttl: The number of seconds cached metadata is reused
+                before it is requested again. None keeps it until it is evicted.
+
+            release_page_cache: If True, downloaded files are synced to disk and
+                dropped from the page cache when they are closed, so that large
+                downloads do not evict other cached data. This makes each download
+                wait for its data to reach the disk. Only applies to downloads to
+                file names on platforms with ``os.posix_fadvise``.
         """
         self.use_threads = use_threads
         self.directory = directory
@@ -73,12 +135,48 @@ class TransferConfig:
         self.io_chunksize = io_chunksize
         self.num_download_attempts = num_download_attempts
         self.max_bandwidth = max_bandwidth
+        self.multipart_chunksize = multipart_chunksize
+        self.max_in_memory_upload_chunks = max_in_memory_upload_chunks
+        self.max_in_memory_download_chunks = max_in_memory_download_chunks
+        self.download_retry_base_delay = download_retry_base_delay
+        self.download_retry_max_delay = download_retry_max_delay
+        self.metadata_cache_size = metadata_cache_size
+        self.metadata_cache_ttl = metadata_cache_ttl
+        self.release_page_cache = release_page_cache
         self._validate_attrs_are_nonzero()
+        self._validate_attrs_are_non_negative()
+        self._validate_float_attrs_are_positive()
 
     def _validate_attrs_are_nonzero(self) -> None:
         for attr, attr_val in self.__dict__.items():
+            if attr in NON_NEGATIVE_ATTRS or attr in POSITIVE_FLOAT_ATTRS:
+                continue
             if attr_val is not None and (type(attr_val) == int) and attr_val <= 0:
                 raise ValueError(
                     "Provided parameter %s of value %s must be greater than "
                     "0." % (attr, attr_val)
                 )
+
+    def _validate_attrs_are_non_negative(self) -> None:
+        for attr in NON_NEGATIVE_ATTRS:
+            attr_val = getattr(self, attr)
+            is_number = isinstance(attr_val, (int, float)) and not isinstance(attr_val, bool)
+            # "not >= 0" also rejects NaN.
+            if not is_number or not attr_val >= 0:
+                raise ValueError(
+                    "Provided parameter %s of value %s must be a number greater than "
+                    "or equal to 0." % (attr, attr_val)
+                )
+
+    def _validate_float_attrs_are_positive(self) -> None:
+        for attr in POSITIVE_FLOAT_ATTRS:
+            attr_val = getattr(self, attr)
+            if attr_val is None:
+                continue
+            is_number = isinstance(attr_val, (int, float)) and not isinstance(attr_val, bool)
+            # "not > 0" also rejects NaN.
+            if not is_number or not attr_val > 0:
+                raise ValueError(
+                    "Provided parameter %s of value %s must be a number greater than "
+                    "0." % (attr, attr_val)
+                )
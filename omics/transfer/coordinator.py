@@ -0,0 +1,84 @@
+import logging
+import threading
+from concurrent.futures import CancelledError
+from typing import List, Set, Type
+
+from s3transfer.futures import TransferCoordinator
+
+logger = logging.getLogger(__name__)
+
+# Number of independently locked shards used to track transfer coordinators.
+NUM_COORDINATOR_SHARDS: int = 16
+
+
+# This implements the interface of s3transfer's TransferCoordinatorController instead of
+# subclassing it. The parent's lock and set would be replaced by the shards and left
+# unused, and its cancel and wait are simple enough to implement here rather than rely on
+# them only going through tracked_transfer_coordinators.
+class ShardedCoordinatorController:
+    """Transfer coordinator controller that spreads tracking across locked shards.
+
+    Coordinators are assigned to a shard by ``transfer_id``, so adding and removing
+    coordinators of different transfers do not contend for the same lock.
+    """
+
+    def __init__(self, num_shards: int = NUM_COORDINATOR_SHARDS):
+        """Initialize the controller.
+
+        Args:
+            num_shards: The number of shards to spread coordinators across.
+        """
+        self._num_shards = num_shards
+        self._shard_locks: List[threading.Lock] = [threading.Lock() for _ in range(num_shards)]
+        self._shards: List[Set[TransferCoordinator]] = [set() for _ in range(num_shards)]
+
+    @property
+    def tracked_transfer_coordinators(self) -> Set[TransferCoordinator]:
+        """The set of transfer coordinators being tracked across all shards."""
+        tracked: Set[TransferCoordinator] = set()
+        for lock, shard in zip(self._shard_locks, self._shards):
+            with lock:
+                tracked.update(shard)
+        return tracked
+
+    def add_transfer_coordinator(self, transfer_coordinator: TransferCoordinator) -> None:
+        """Track a transfer coordinator so that it can be waited on or cancelled."""
+        index = self._shard_index(transfer_coordinator)
+        with self._shard_locks[index]:
+            self._shards[index].add(transfer_coordinator)
+
+    def remove_transfer_coordinator(self, transfer_coordinator: TransferCoordinator) -> None:
+        """Stop tracking a transfer coordinator once its transfer is complete."""
+        index = self._shard_index(transfer_coordinator)
+        with self._shard_locks[index]:
+            self._shards[index].remove(transfer_coordinator)
+
+    def cancel(self, msg: str = "", exc_type: Type[BaseException] = CancelledError) -> None:
+        """Cancel all in-progress transfers.
+
+        Args:
+            msg: The message to pass on to each cancelled transfer coordinator.
+
+            exc_type: The type of exception to set for the cancellation.
+        """
+        for transfer_coordinator in self.tracked_transfer_coordinators:
+            transfer_coordinator.cancel(msg, exc_type)
+
+    def wait(self) -> None:
+        """Wait until there are no more in-progress transfers.
+
+        Failed transfers are ignored, but the wait can be interrupted with a
+        KeyboardInterrupt.
+        """
+        for transfer_coordinator in self.tracked_transfer_coordinators:
+            try:
+                transfer_coordinator.result()
+            except KeyboardInterrupt:
+                logger.debug("On KeyboardInterrupt was waiting for %s", transfer_coordinator)
+                raise
+            except Exception:
+                # The transfer failed, but it has completed.
+                pass
+
+    def _shard_index(self, transfer_coordinator: TransferCoordinator) -> int:
+        return transfer_coordinator.transfer_id % self._num_shards
@@ -1,7 +1,10 @@
 import gzip
 import logging
+import os
+import random
 import socket
-from typing import IO, Any, List, Union
+import time
+from typing import IO, Any, Callable, Dict, List, Mapping, Optional, Union
 
 from botocore.exceptions import IncompleteReadError, ReadTimeoutError
 from mypy_boto3_omics.client import OmicsClient
@@ -11,11 +14,12 @@ from s3transfer.download import (
     DownloadOutputManager,
 )
 from s3transfer.exceptions import RetriesExceededError
-from s3transfer.futures import BoundedExecutor, TransferFuture
+from s3transfer.futures import BoundedExecutor, TransferCoordinator, TransferFuture
 from s3transfer.subscribers import BaseSubscriber
 from s3transfer.tasks import SubmissionTask, Task
 from s3transfer.utils import (
     CountCallbackInvoker,
+    DeferredOpenFile,
     FunctionContainer,
     StreamReaderProgress,
     get_callbacks,
@@ -37,6 +41,9 @@ RETRYABLE_DOWNLOAD_ERRORS = (
     ReadTimeoutError,
 )
 
+# How often a retry delay checks whether the transfer was cancelled, in seconds.
+RETRY_POLL_INTERVAL = 0.1
+
 
 class DownloadSubmissionTask(SubmissionTask):
     """Task for submitting tasks to execute a file download."""
@@ -49,6 +56,8 @@ class DownloadSubmissionTask(SubmissionTask):
         request_executor: BoundedExecutor,
         download_manager: DownloadOutputManager,
         io_executor: BoundedExecutor,
+        metadata_files: Optional[Mapping[str, Any]] = None,
+        get_metadata_files: Optional[Callable[[], Mapping[str, Any]]] = None,
     ) -> None:
         # Get the needed progress callbacks for the task
         progress_callbacks = get_callbacks(transfer_future, "progress")
@@ -58,29 +67,24 @@ class DownloadSubmissionTask(SubmissionTask):
 
         transfer_args: FileDownload = transfer_future.meta.call_args  # type: ignore
 
-        if transfer_args.omics_file_type == OmicsFileType.REFERENCE:
-            metadata_response = client.get_reference_metadata(
-                referenceStoreId=transfer_args.store_id, id=transfer_args.file_set_id
-            )
-            metadata_files = metadata_response["files"]
-        elif transfer_args.omics_file_type == OmicsFileType.READSET:
-            metadata_response = client.get_read_set_metadata(
-                sequenceStoreId=transfer_args.store_id, id=transfer_args.file_set_id
-            )  # type: ignore
-            metadata_files = metadata_response["files"]
-        else:
-            raise AttributeError(f"Unexpected Omics file type: {transfer_args.omics_file_type}")
+        # Only fetch the metadata if the caller did not already provide it. A provided
+        # loader lets downloads from the same reference or read set share one request.
+        if metadata_files is None:
+            if get_metadata_files is not None:
+                metadata_files = get_metadata_files()
+            else:
+                metadata_files = _get_metadata_files(client, transfer_args)
 
         filename_key = transfer_args.filename.lower()
-
-        if filename_key not in metadata_files.keys():
+        file_metadata = metadata_files.get(filename_key)
+        if file_metadata is None:
             raise ValueError(
                 f"File '{filename_key}' was not found in sequence store: {transfer_args.store_id}"
             )
 
-        part_size = metadata_files[filename_key]["partSize"]
-        num_parts = metadata_files[filename_key]["totalParts"]
-        content_length = metadata_files[filename_key]["contentLength"]
+        part_size = file_metadata["partSize"]
+        num_parts = file_metadata["totalParts"]
+        content_length = file_metadata["contentLength"]
 
         transfer_future.meta.provide_transfer_size(content_length)
         # Get any associated tags for the get object task.
@@ -93,6 +97,24 @@ class DownloadSubmissionTask(SubmissionTask):
             )
         )
 
+        # Only the part number and start index differ between parts, so the rest of
+        # the task arguments are built once for the whole file.
+        shared_kwargs = {
+            "client": client,
+            "omics_file_type": transfer_args.omics_file_type,
+            "store_id": transfer_args.store_id,
+            "file_set_id": transfer_args.file_set_id,
+            "fileobj": fileobj,
+            "file": transfer_args.filename,
+            "callbacks": progress_callbacks,
+            "max_attempts": config.num_download_attempts,
+            "download_output_manager": download_manager,
+            "io_chunksize": config.io_chunksize,
+            "retry_base_delay": config.download_retry_base_delay,
+            "retry_max_delay": config.download_retry_max_delay,
+        }
+        done_callbacks = [io_finalize_callback.decrement]
+
         for i in range(num_parts):
             io_finalize_callback.increment()
             self._transfer_coordinator.submit(
@@ -100,20 +122,11 @@ class DownloadSubmissionTask(SubmissionTask):
                 GetFileTask(
                     transfer_coordinator=self._transfer_coordinator,
                     main_kwargs={
-                        "client": client,
-                        "omics_file_type": transfer_args.omics_file_type,
-                        "store_id": transfer_args.store_id,
-                        "file_set_id": transfer_args.file_set_id,
+                        **shared_kwargs,
                         "part_number": i + 1,
-                        "fileobj": fileobj,
-                        "file": transfer_args.filename,
-                        "callbacks": progress_callbacks,
-                        "max_attempts": config.num_download_attempts,
                         "start_index": i * part_size,
-                        "download_output_manager": download_manager,
-                        "io_chunksize": config.io_chunksize,
                     },
-                    done_callbacks=[io_finalize_callback.decrement],
+                    done_callbacks=done_callbacks,
                 ),
                 tag=get_object_tag,
             )
@@ -137,36 +150,39 @@ class GetFileTask(Task):
         download_output_manager: DownloadOutputManager,
         io_chunksize: int,
         start_index: int = 0,
+        retry_base_delay: float = 0.0,
+        retry_max_delay: float = 0.0,
     ) -> None:
+        # The request is the same on every attempt, so resolve it up front.
+        get_file: Callable[..., Any]
+        get_file_kwargs: Dict[str, Any]
+        if omics_file_type == OmicsFileType.REFERENCE:
+            get_file = client.get_reference
+            get_file_kwargs = {"referenceStoreId": store_id}
+        elif omics_file_type == OmicsFileType.READSET:
+            get_file = client.get_read_set
+            get_file_kwargs = {"sequenceStoreId": store_id}
+        else:
+            raise AttributeError(f"Unexpected Omics file type: {omics_file_type}")
+        get_file_kwargs.update(id=file_set_id, partNumber=part_number, file=file)
+
+        # Bind the per-chunk lookups once; the chunk loop below runs for every
+        # io_chunksize of the part.
+        done = self._transfer_coordinator.done
+        queue_file_io_task = download_output_manager.queue_file_io_task
         last_exception = None
         for i in range(max_attempts):
             current_index = start_index
             try:
-                if omics_file_type == OmicsFileType.REFERENCE:
-                    response = client.get_reference(
-                        referenceStoreId=store_id,
-                        id=file_set_id,
-                        partNumber=part_number,
-                        file=file,
-                    )
-                elif omics_file_type == OmicsFileType.READSET:
-                    response = client.get_read_set(
-                        sequenceStoreId=store_id,
-                        id=file_set_id,
-                        partNumber=part_number,
-                        file=file,
-                    )
-                else:
-                    raise AttributeError(f"Unexpected Omics file type: {omics_file_type}")
-
+                response = get_file(**get_file_kwargs)
                 streaming_body = StreamReaderProgress(response["payload"], callbacks)
                 chunks = DownloadChunkIterator(streaming_body, io_chunksize)
                 for chunk in chunks:
                     # If the transfer is done because of a cancellation
                     # or error somewhere else, stop trying to submit more
                     # data to be written and break out of the download.
-                    if not self._transfer_coordinator.done():
-                        download_output_manager.queue_file_io_task(fileobj, chunk, current_index)
+                    if not done():
+                        queue_file_io_task(fileobj, chunk, current_index)
                         current_index += len(chunk)
                     else:
                         return
@@ -184,6 +200,13 @@ class GetFileTask(Task):
                 # are trying to download the stream again and all progress
                 # for this GetObject has been lost.
                 invoke_progress_callbacks(callbacks, start_index - current_index)
+                if i + 1 < max_attempts:
+                    # Back off with full jitter so that parts failing together do
+                    # not all retry at the same moment.
+                    delay = random.uniform(0, min(retry_max_delay, retry_base_delay * 2**i))
+                    _wait_for_retry(self._transfer_coordinator, delay)
+                    if self._transfer_coordinator.done():
+                        return
                 continue
         raise RetriesExceededError(last_exception)
 
@@ -194,6 +217,23 @@ class OmicsDownloadFilenameOutputManager(DownloadFilenameOutputManager):
     Overrides the parent class to support modifying the filename after download.
     """
 
+    def __init__(self, osutil, transfer_coordinator, io_executor, release_page_cache=False):
+        """Create the output manager.
+
+        If ``release_page_cache`` is True, the downloaded data is dropped from the page
+        cache once the file is written, where ``os.posix_fadvise`` is available.
+        """
+        super().__init__(osutil, transfer_coordinator, io_executor)
+        self._release_page_cache = release_page_cache
+
+    def _get_fileobj_from_filename(self, filename):
+        """Open the temporary file, releasing its pages on close if configured to."""
+        if not self._release_page_cache or not hasattr(os, "posix_fadvise"):
+            return super()._get_fileobj_from_filename(filename)
+        f = SequentialWriteFile(filename, mode="wb", open_function=self._osutil.open)
+        self._transfer_coordinator.add_failure_cleanup(f.close)
+        return f
+
     def get_final_io_task(self):
         """Rename the file from the temporary file to its final location as the final IO task."""
         return OmicsIORenameFileTask(
@@ -223,6 +263,64 @@ class OmicsIORenameFileTask(Task):
         osutil.rename_file(fileobj.name, final_filename)
 
 
+class SequentialWriteFile(DeferredOpenFile):
+    """A deferred-open file which keeps written data out of the page cache.
+
+    Downloaded files are rarely read back right away, so the file is opened with
+    ``POSIX_FADV_SEQUENTIAL`` and, once closed, its pages are released with
+    ``POSIX_FADV_DONTNEED`` instead of evicting other cached pages. Dirty pages
+    cannot be dropped, so the file is synced first.
+    Only usable where ``os.posix_fadvise`` is available.
+    """
+
+    def _open_if_needed(self):
+        if self._fileobj is None:
+            super()._open_if_needed()
+            _fadvise(self._fileobj, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    def close(self):
+        """Sync the file and drop its pages from the page cache before closing it."""
+        if self._fileobj is not None and not self._fileobj.closed:
+            self._fileobj.flush()
+            os.fdatasync(self._fileobj.fileno())
+            _fadvise(self._fileobj, 0, 0, os.POSIX_FADV_DONTNEED)
+        super().close()
+
+
+def _wait_for_retry(transfer_coordinator: TransferCoordinator, delay: float) -> None:
+    """Sleep before a retry, waking up early if the transfer is done (e.g. cancelled)."""
+    deadline = time.monotonic() + delay
+    while not transfer_coordinator.done():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, RETRY_POLL_INTERVAL))
+
+
+def _fadvise(fileobj: IO[Any], offset: int, length: int, advice: int) -> None:
+    """Apply file access advice, ignoring files that do not support it."""
+    try:
+        os.posix_fadvise(fileobj.fileno(), offset, length, advice)
+    except (OSError, ValueError):
+        logger.debug("Unable to apply fadvise %s to %s", advice, fileobj, exc_info=True)
+
+
+def _get_metadata_files(client: OmicsClient, transfer_args: FileDownload) -> Mapping[str, Any]:
+    """Fetch the file metadata of the reference or read set being downloaded."""
+    if transfer_args.omics_file_type == OmicsFileType.REFERENCE:
+        metadata_response = client.get_reference_metadata(
+            referenceStoreId=transfer_args.store_id, id=transfer_args.file_set_id
+        )
+        return metadata_response["files"]
+    elif transfer_args.omics_file_type == OmicsFileType.READSET:
+        metadata_response = client.get_read_set_metadata(
+            sequenceStoreId=transfer_args.store_id, id=transfer_args.file_set_id
+        )  # type: ignore
+        return metadata_response["files"]
+    else:
+        raise AttributeError(f"Unexpected Omics file type: {transfer_args.omics_file_type}")
+
+
 def _file_is_gzipped(filename: str) -> bool:
     with gzip.open(filename, "r") as fh:
         try:
@@ -0,0 +1,36 @@
+from typing import Callable, Optional
+
+from s3transfer.futures import BoundedExecutor, ExecutorFuture, TaskTag
+
+
+class UnboundedExecutor(BoundedExecutor):
+    """A ``BoundedExecutor`` that never blocks submitters.
+
+    Tasks are handed straight to the underlying executor without acquiring a
+    semaphore. This suits a single consumer (such as the IO executor) whose tasks
+    never wait on the producers, so producers cannot deadlock on it.
+    Tags select a semaphore to bound tasks by, so they are not supported.
+    """
+
+    def __init__(self, max_num_threads: int, executor_cls: Optional[type] = None):
+        """Create the executor.
+
+        Args:
+            max_num_threads: The maximum number of threads the executor uses.
+
+            executor_cls: The underlying executor class. Defaults to ``ThreadPoolExecutor``.
+        """
+        # The parent's __init__ is not called because it only adds the semaphores this
+        # executor never uses. Only the underlying executor, used by shutdown(), is set up.
+        self._max_num_threads = max_num_threads
+        if executor_cls is None:
+            executor_cls = self.EXECUTOR_CLS
+        self._executor = executor_cls(max_workers=max_num_threads)
+
+    def submit(
+        self, task: Callable, tag: Optional[TaskTag] = None, block: bool = True
+    ) -> ExecutorFuture:
+        """Submit a task without waiting for room in a queue."""
+        if tag is not None:
+            raise ValueError(f"UnboundedExecutor does not support task tags, got: {tag}")
+        return ExecutorFuture(self._executor.submit(task))
@@ -1,28 +1,51 @@
+import functools
+import itertools
 import logging
 import os
+import queue
 import re
-from concurrent.futures import CancelledError
-from typing import IO, Any, Dict, List, Optional, Type, Union
+import stat
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from mypy_boto3_omics.client import OmicsClient
-from s3transfer.bandwidth import BandwidthLimiter, LeakyBucket
-from s3transfer.download import (
-    DownloadNonSeekableOutputManager,
-    DownloadOutputManager,
-    DownloadSeekableOutputManager,
+from mypy_boto3_omics.type_defs import (
+    GetReadSetMetadataResponseTypeDef,
+    GetReferenceMetadataResponseTypeDef,
 )
+from s3transfer.bandwidth import BandwidthLimiter, LeakyBucket
 from s3transfer.exceptions import FatalError
 from s3transfer.futures import (
+    IN_MEMORY_DOWNLOAD_TAG,
+    IN_MEMORY_UPLOAD_TAG,
     BoundedExecutor,
     NonThreadedExecutor,
     TransferCoordinator,
     TransferFuture,
     TransferMeta,
 )
-from s3transfer.manager import TransferCoordinatorController
-from s3transfer.utils import OSUtils, get_callbacks
+from s3transfer.utils import (
+    OSUtils,
+    SlidingWindowSemaphore,
+    TaskSemaphore,
+    get_callbacks,
+)
 
 from omics.common.omics_file_types import (
+    ExtendedEnum,
     OmicsFileType,
     ReadSetFileName,
     ReferenceFileName,
@@ -34,11 +57,17 @@ from omics.transfer import (
     ReadSetUpload,
 )
 from omics.transfer.config import TransferConfig
-from omics.transfer.download import (
-    DownloadSubmissionTask,
-    OmicsDownloadFilenameOutputManager,
+from omics.transfer.coordinator import ShardedCoordinatorController
+from omics.transfer.executor import UnboundedExecutor
+from omics.transfer.metadata_cache import MetadataCache
+from omics.transfer.read_set_upload import (
+    ReadSetUploadSubmissionTask,
+    signal_not_transferring,
+    signal_transferring,
 )
-from omics.transfer.read_set_upload import ReadSetUploadSubmissionTask
+
+if TYPE_CHECKING:
+    from s3transfer.download import DownloadOutputManager
 
 DONE_CALLBACK_TYPE: str = "done"
 
@@ -54,6 +83,12 @@ FILE_TYPE_EXTENSION_MAP: dict[str, str] = {
     "UBAM": "bam",
 }
 
+# Data file extensions (with the period) removed from user provided names before applying
+# our own, in the order they are checked.
+STRIPPED_FILE_EXTENSIONS: Tuple[str, ...] = tuple(
+    "." + ext for ext in FILE_TYPE_EXTENSION_MAP.values()
+)
+
 # Map of file type to index file extension.
 FILE_TYPE_INDEX_EXTENSION_MAP: dict[str, str] = {
     "FASTA": "fasta.fai",
@@ -61,6 +96,29 @@ FILE_TYPE_INDEX_EXTENSION_MAP: dict[str, str] = {
     "CRAM": "cram.crai",
 }
 
+# Maps of file type to the suffix (extension with its leading period) appended to local
+# data and index file names.
+FILE_TYPE_SUFFIX_MAP: dict[str, str] = {
+    file_type: f".{extension}" for file_type, extension in FILE_TYPE_EXTENSION_MAP.items()
+}
+FILE_TYPE_INDEX_SUFFIX_MAP: dict[str, str] = {
+    file_type: f".{extension}" for file_type, extension in FILE_TYPE_INDEX_EXTENSION_MAP.items()
+}
+
+# Characters removed when deriving a local file name (anything but alphanumerics, dash,
+# underscore or dot).
+INVALID_FILENAME_CHARACTERS: re.Pattern = re.compile(r"(?u)[^-\w.]")
+
+# Translation table deleting the same characters as above from ASCII-only names.
+INVALID_ASCII_FILENAME_CHARACTERS_TABLE: dict[int, None] = str.maketrans(
+    "",
+    "",
+    "".join(c for c in map(chr, range(128)) if INVALID_FILENAME_CHARACTERS.match(c)),
+)
+
+# Names which cannot be used as a local file name.
+RESERVED_FILENAMES: frozenset[str] = frozenset({"", ".", ".."})
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,11 +140,10 @@ class TransferManager:
         self._client = client
         self._config = config if config is not None else TransferConfig()
         self._osutil = OSUtils()
-        self._coordinator_controller = TransferCoordinatorController()
-        self._current_transfer_id = 1
+        self._coordinator_controller = ShardedCoordinatorController()
 
         # A counter to create unique id's for each transfer submitted.
-        self._id_counter = 0
+        self._transfer_id_counter = itertools.count(1)
 
         # Passing a NonThreadedExecutor to BoundedExecutor causes it to run
         # everything in a single thread.  The default is ThreadPoolExecutor.
@@ -96,23 +153,52 @@ class TransferManager:
         self._request_executor = BoundedExecutor(
             max_size=self._config.max_request_queue_size,
             max_num_threads=self._config.max_request_concurrency,
+            tag_semaphores={
+                IN_MEMORY_UPLOAD_TAG: TaskSemaphore(self._config.max_in_memory_upload_chunks),
+                IN_MEMORY_DOWNLOAD_TAG: SlidingWindowSemaphore(
+                    self._config.max_in_memory_download_chunks
+                ),
+            },
             executor_cls=executor_cls,
         )
 
         # The executor responsible for submitting the necessary tasks to
-        # perform the desired transfer
-        self._submission_executor = BoundedExecutor(
-            max_size=self._config.max_submission_queue_size,
-            max_num_threads=self._config.max_submission_concurrency,
-            executor_cls=executor_cls,
-        )
+        # perform the desired transfer. Submission threads are only started as
+        # transfers are queued, up to max_submission_concurrency.
+        if self._config.max_submission_queue_size is None:
+            self._submission_executor: BoundedExecutor = UnboundedExecutor(
+                max_num_threads=self._config.max_submission_concurrency,
+                executor_cls=executor_cls,
+            )
+        else:
+            self._submission_executor = BoundedExecutor(
+                max_size=self._config.max_submission_queue_size,
+                max_num_threads=self._config.max_submission_concurrency,
+                executor_cls=executor_cls,
+            )
 
         # There is one thread available for writing to disk. It will handle
         # downloads for all files.
-        self._io_executor = BoundedExecutor(
-            max_size=self._config.max_io_queue_size,
-            max_num_threads=1,
-            executor_cls=executor_cls,
+        if self._config.max_io_queue_size is None:
+            self._io_executor: BoundedExecutor = UnboundedExecutor(
+                max_num_threads=1,
+                executor_cls=executor_cls,
+            )
+        else:
+            self._io_executor = BoundedExecutor(
+                max_size=self._config.max_io_queue_size,
+                max_num_threads=1,
+                executor_cls=executor_cls,
+            )
+
+        # Reference and read set metadata is cached by (store ID, ID) to avoid repeat API
+        # calls across downloads. The caches are bounded and entries expire, so that a
+        # long-lived manager neither grows without limit nor serves stale metadata forever.
+        self._reference_metadata_cache: MetadataCache[GetReferenceMetadataResponseTypeDef] = (
+            MetadataCache(self._config.metadata_cache_size, self._config.metadata_cache_ttl)
+        )
+        self._read_set_metadata_cache: MetadataCache[GetReadSetMetadataResponseTypeDef] = (
+            MetadataCache(self._config.metadata_cache_size, self._config.metadata_cache_ttl)
         )
 
         # The component responsible for limiting bandwidth usage if it is configured.
@@ -122,13 +208,16 @@ class TransferManager:
             leaky_bucket = LeakyBucket(self._config.max_bandwidth)
             self._bandwidth_limiter = BandwidthLimiter(leaky_bucket)
 
+        self._register_handlers()
+
     def download_reference(
         self,
         reference_store_id: str,
         reference_id: str,
         directory: str = None,
-        subscribers: List[OmicsTransferSubscriber] = [],
+        subscribers: Optional[List[OmicsTransferSubscriber]] = None,
         wait: bool = True,
+        metadata: Optional[GetReferenceMetadataResponseTypeDef] = None,
     ) -> List[OmicsTransferFuture]:
         """Download all files for an Omics reference dataset.
 
@@ -143,28 +232,30 @@ class TransferManager:
             subscribers: one or more subscribers for receiving transfer events.
 
             wait: True = block until all files have been downloaded (default).
+                If any file fails, the downloads of the other files are cancelled.
                 False = return a list of futures for controlling how to wait.
+
+            metadata: The GetReferenceMetadata response for this reference, if the caller already
+                has it. It is used instead of requesting the metadata again.
         """
-        reference_metadata = self._client.get_reference_metadata(
-            referenceStoreId=reference_store_id, id=reference_id
-        )
+        if metadata is not None:
+            # Cache it so that the downloads of the individual files reuse it too.
+            self._reference_metadata_cache.put((reference_store_id, reference_id), metadata)
+        reference_metadata = self._get_reference_metadata(reference_store_id, reference_id)
 
         transfer_futures: List[OmicsTransferFuture] = []
         if directory is None:
             directory = self._config.directory
         _create_directory(directory)
 
-        for filename in reference_metadata["files"]:
-            reference_file = ReferenceFileName.from_object(filename.upper())
-            file_path = os.path.join(
-                directory,
-                _format_local_filename(
-                    reference_metadata["name"],
-                    reference_file,
-                    REFERENCE_FILE_TYPE,
-                ),
-            )
-
+        download_specs = _build_download_specs(
+            directory,
+            reference_metadata["name"],
+            REFERENCE_FILE_TYPE,
+            reference_metadata["files"],
+            ReferenceFileName,
+        )
+        for reference_file, file_path in download_specs:
             transfer_future = self.download_reference_file(
                 reference_store_id=reference_store_id,
                 reference_id=reference_id,
@@ -176,8 +267,7 @@ class TransferManager:
             transfer_futures.append(transfer_future)
 
         if wait:
-            for future in transfer_futures:
-                future.result()
+            _wait_for_transfers(transfer_futures)
         return transfer_futures
 
     def download_reference_file(
@@ -186,7 +276,7 @@ class TransferManager:
         reference_id: str,
         server_filename: ReferenceFileName,
         client_fileobj: Union[IO[Any], str] = None,
-        subscribers: List[OmicsTransferSubscriber] = [],
+        subscribers: Optional[List[OmicsTransferSubscriber]] = None,
         wait: bool = True,
     ) -> OmicsTransferFuture:
         """Download a single Omics reference file.
@@ -208,11 +298,13 @@ class TransferManager:
         """
         server_filename_enum = ReferenceFileName.from_object(server_filename)
 
+        # Reuse metadata that has already been fetched so the submission task does not
+        # need to request it again.
+        reference_metadata = self._reference_metadata_cache.get((reference_store_id, reference_id))
+
         # If a file object was not supplied then format a filename from the original name
         if client_fileobj is None:
-            reference_metadata = self._client.get_reference_metadata(
-                referenceStoreId=reference_store_id, id=reference_id
-            )
+            reference_metadata = self._get_reference_metadata(reference_store_id, reference_id)
             _create_directory(self._config.directory)
             client_fileobj = os.path.join(
                 self._config.directory,
@@ -231,6 +323,7 @@ class TransferManager:
             client_fileobj,
             subscribers,
             wait,
+            metadata_files=None if reference_metadata is None else reference_metadata["files"],
         )
 
     def download_read_set(
@@ -238,8 +331,9 @@ class TransferManager:
         sequence_store_id: str,
         read_set_id: str,
         directory: str = None,
-        subscribers: List[OmicsTransferSubscriber] = [],
+        subscribers: Optional[List[OmicsTransferSubscriber]] = None,
         wait: bool = True,
+        metadata: Optional[GetReadSetMetadataResponseTypeDef] = None,
     ) -> List[OmicsTransferFuture]:
         """Download all files for an Omics read set.
 
@@ -254,31 +348,32 @@ class TransferManager:
             subscribers: one or more subscribers for receiving transfer events.
 
             wait: True = block until all files have been downloaded (default).
+                If any file fails, the downloads of the other files are cancelled.
                 False = return a list of futures for controlling how to wait.
+
+            metadata: The GetReadSetMetadata response for this read set, if the caller already
+                has it. It is used instead of requesting the metadata again.
         """
-        read_set_metadata = self._client.get_read_set_metadata(
-            sequenceStoreId=sequence_store_id, id=read_set_id
-        )
+        if metadata is not None:
+            # Cache it so that the downloads of the individual files reuse it too.
+            self._read_set_metadata_cache.put((sequence_store_id, read_set_id), metadata)
+        read_set_metadata = self._get_read_set_metadata(sequence_store_id, read_set_id)
 
         transfer_futures: List[OmicsTransferFuture] = []
         if directory is None:
             directory = self._config.directory
         _create_directory(directory)
 
-        add_source_counter = True if "source2" in read_set_metadata["files"] else False
-
-        for filename in read_set_metadata["files"]:
-            read_set_file = ReadSetFileName.from_object(filename.upper())
-            file_path = os.path.join(
-                directory,
-                _format_local_filename(
-                    read_set_metadata["name"],
-                    read_set_file,
-                    read_set_metadata["fileType"],
-                    add_source_counter,
-                ),
-            )
-
+        files = read_set_metadata["files"]
+        download_specs = _build_download_specs(
+            directory,
+            read_set_metadata["name"],
+            read_set_metadata["fileType"],
+            files,
+            ReadSetFileName,
+            add_source_counter="source2" in files,
+        )
+        for read_set_file, file_path in download_specs:
             transfer_future = self.download_read_set_file(
                 sequence_store_id=sequence_store_id,
                 read_set_id=read_set_id,
@@ -290,8 +385,7 @@ class TransferManager:
             transfer_futures.append(transfer_future)
 
         if wait:
-            for future in transfer_futures:
-                future.result()
+            _wait_for_transfers(transfer_futures)
         return transfer_futures
 
     def download_read_set_file(
@@ -300,7 +394,7 @@ class TransferManager:
         read_set_id: str,
         server_filename: ReadSetFileName,
         client_fileobj: Union[IO[Any], str] = None,
-        subscribers: List[OmicsTransferSubscriber] = [],
+        subscribers: Optional[List[OmicsTransferSubscriber]] = None,
         wait: bool = True,
     ) -> OmicsTransferFuture:
         """Download a single Omics read set file.
@@ -322,12 +416,14 @@ class TransferManager:
         """
         server_filename_enum = ReadSetFileName.from_object(server_filename)
 
+        # Reuse metadata that has already been fetched so the submission task does not
+        # need to request it again.
+        read_set_metadata = self._read_set_metadata_cache.get((sequence_store_id, read_set_id))
+
         # If a file object was not supplied then format a filename from the original name
         if client_fileobj is None:
-            read_set_metadata = self._client.get_read_set_metadata(
-                sequenceStoreId=sequence_store_id, id=read_set_id
-            )
-            add_source_counter = True if "source2" in read_set_metadata["files"] else False
+            read_set_metadata = self._get_read_set_metadata(sequence_store_id, read_set_id)
+            add_source_counter = "source2" in read_set_metadata["files"]
             _create_directory(self._config.directory)
             client_fileobj = os.path.join(
                 self._config.directory,
@@ -347,6 +443,7 @@ class TransferManager:
             client_fileobj,
             subscribers,
             wait,
+            metadata_files=None if read_set_metadata is None else read_set_metadata["files"],
         )
 
     def upload_read_set(
@@ -418,8 +515,9 @@ class TransferManager:
 
         # Add any provided done callbacks to the first created transfer future
         # to be invoked on the entire upload being complete.
-        for callback in get_callbacks(transfer_future, DONE_CALLBACK_TYPE):
-            transfer_coordinator.add_done_callback(callback)
+        if subscribers:
+            for callback in get_callbacks(transfer_future, DONE_CALLBACK_TYPE):
+                transfer_coordinator.add_done_callback(callback)
 
         # Return the upload task so that users can await the read set ID it creates
         self._submission_executor.submit(
@@ -432,15 +530,98 @@ class TransferManager:
                     "transfer_future": transfer_future,
                     "paired_transfer_future": paired_transfer_future,
                     "bandwidth_limiter": self._bandwidth_limiter,
+                    "config": self._config,
                 },
             )
         )
 
         return transfer_future if not wait else transfer_future.result()
 
+    def prefetch_reference_metadata(self, references: Iterable[Tuple[str, str]]) -> None:
+        """Fetch the metadata of many references concurrently.
+
+        The metadata is cached so that later calls to ``download_reference_file``
+        and ``download_reference`` for these references do not need to request it.
+
+        Args:
+            references: (reference store ID, reference ID) pairs to fetch metadata for.
+        """
+        self._prefetch_metadata(
+            references, self._reference_metadata_cache, self._get_reference_metadata
+        )
+
+    def prefetch_read_set_metadata(self, read_sets: Iterable[Tuple[str, str]]) -> None:
+        """Fetch the metadata of many read sets concurrently.
+
+        The metadata is cached so that later calls to ``download_read_set_file``
+        and ``download_read_set`` for these read sets do not need to request it.
+
+        Args:
+            read_sets: (sequence store ID, read set ID) pairs to fetch metadata for.
+        """
+        self._prefetch_metadata(
+            read_sets, self._read_set_metadata_cache, self._get_read_set_metadata
+        )
+
+    def _prefetch_metadata(
+        self,
+        keys: Iterable[Tuple[str, str]],
+        cache: MetadataCache,
+        get_metadata: Callable[[str, str], Any],
+    ) -> None:
+        missing_keys = [key for key in dict.fromkeys(keys) if key not in cache]
+        if not self._config.use_threads:
+            for key in missing_keys:
+                get_metadata(*key)
+            return
+
+        max_workers = min(self._config.max_request_concurrency, len(missing_keys))
+        if max_workers == 0:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(get_metadata, *key) for key in missing_keys]
+            for future in futures:
+                future.result()
+
+    def _get_reference_metadata(
+        self, reference_store_id: str, reference_id: str
+    ) -> GetReferenceMetadataResponseTypeDef:
+        """Get the metadata of a reference, calling the service only if it is not cached."""
+        return self._reference_metadata_cache.get_or_load(
+            (reference_store_id, reference_id),
+            lambda: self._client.get_reference_metadata(
+                referenceStoreId=reference_store_id, id=reference_id
+            ),
+        )
+
+    def _get_read_set_metadata(
+        self, sequence_store_id: str, read_set_id: str
+    ) -> GetReadSetMetadataResponseTypeDef:
+        """Get the metadata of a read set, calling the service only if it is not cached."""
+        return self._read_set_metadata_cache.get_or_load(
+            (sequence_store_id, read_set_id),
+            lambda: self._client.get_read_set_metadata(
+                sequenceStoreId=sequence_store_id, id=read_set_id
+            ),
+        )
+
+    def _get_metadata_files(
+        self, omics_file_type: OmicsFileType, store_id: str, file_set_id: str
+    ) -> Mapping[str, Any]:
+        """Get the ``files`` field of the reference or read set metadata."""
+        if omics_file_type == OmicsFileType.REFERENCE:
+            return self._get_reference_metadata(store_id, file_set_id)["files"]
+        elif omics_file_type == OmicsFileType.READSET:
+            return self._get_read_set_metadata(store_id, file_set_id)["files"]
+        else:
+            raise AttributeError(f"Unexpected Omics file type: {omics_file_type}")
+
     def _get_future_coordinator(self) -> TransferCoordinator:
         transfer_id = self._get_next_transfer_id()
-        # Creates a new transfer future along with its components
+        # Creates a new transfer future along with its components.
+        # Coordinators are deliberately not pooled: the OmicsTransferFuture handed back
+        # to the caller keeps reading result/exception state from its coordinator after
+        # the transfer completes, so a recycled instance would leak state between transfers.
         transfer_coordinator = TransferCoordinator(transfer_id=transfer_id)
         # Track the transfer coordinator for transfers to manage.
         self._coordinator_controller.add_transfer_coordinator(transfer_coordinator)
@@ -459,28 +640,37 @@ class TransferManager:
         file_set_id: str,
         server_filename: str,
         client_fileobj: Union[IO[Any], str],
-        subscribers: List[OmicsTransferSubscriber] = [],
+        subscribers: Optional[List[OmicsTransferSubscriber]] = None,
         wait: bool = False,
+        metadata_files: Optional[Mapping[str, Any]] = None,
     ) -> OmicsTransferFuture:
-        """Private helper method for downloading a file."""
+        """Private helper method for downloading a file.
+
+        If ``metadata_files`` (the ``files`` field of the reference or read set metadata)
+        is provided, it is used instead of fetching the metadata again.
+        """
         if client_fileobj is None:
             raise ValueError("client_fileobj parameter is required")
 
+        # Imported here so that processes which only upload never load the download modules.
+        from omics.transfer.download import (
+            DownloadSubmissionTask,
+            OmicsDownloadFilenameOutputManager,
+        )
+
+        download_manager_cls = _get_download_output_manager_cls(client_fileobj, self._osutil)
         transfer_coordinator = self._get_future_coordinator()
-        if OmicsDownloadFilenameOutputManager.is_compatible(client_fileobj, self._osutil):
-            download_manager: DownloadOutputManager = OmicsDownloadFilenameOutputManager(
-                self._osutil, transfer_coordinator, self._io_executor
+        if download_manager_cls is OmicsDownloadFilenameOutputManager:
+            download_manager: "DownloadOutputManager" = OmicsDownloadFilenameOutputManager(
+                self._osutil,
+                transfer_coordinator,
+                self._io_executor,
+                release_page_cache=self._config.release_page_cache,
             )
-        elif DownloadSeekableOutputManager.is_compatible(client_fileobj, self._osutil):
-            download_manager = DownloadSeekableOutputManager(
-                self._osutil, transfer_coordinator, self._io_executor
-            )
-        elif DownloadNonSeekableOutputManager.is_compatible(client_fileobj, self._osutil):
-            download_manager = DownloadNonSeekableOutputManager(
+        else:
+            download_manager = download_manager_cls(
                 self._osutil, transfer_coordinator, self._io_executor
             )
-        else:
-            raise ValueError(f"The client_fileobj (type: {type(client_fileobj)}) is not supported")
 
         file_transfer = FileDownload(
             store_id=store_id,
@@ -494,9 +684,12 @@ class TransferManager:
         transfer_future = OmicsTransferFuture(transfer_meta, transfer_coordinator)
 
         # Add any provided done callbacks to the created transfer future
-        # to be invoked on the transfer future being complete.
-        for callback in get_callbacks(transfer_future, DONE_CALLBACK_TYPE):
-            transfer_coordinator.add_done_callback(callback)
+        # to be invoked on the transfer future being complete. This stays on the
+        # caller's thread so that on_done still fires if the transfer is cancelled
+        # before its submission task runs.
+        if subscribers:
+            for callback in get_callbacks(transfer_future, DONE_CALLBACK_TYPE):
+                transfer_coordinator.add_done_callback(callback)
 
         main_kwargs = {
             "client": self._client,
@@ -505,6 +698,10 @@ class TransferManager:
             "transfer_future": transfer_future,
             "download_manager": download_manager,
             "io_executor": self._io_executor,
+            "metadata_files": metadata_files,
+            "get_metadata_files": functools.partial(
+                self._get_metadata_files, omics_file_type, store_id, file_set_id
+            ),
         }
 
         # Submit a SubmissionTask that will submit all of the necessary
@@ -520,9 +717,23 @@ class TransferManager:
 
         return transfer_future
 
+    def _register_handlers(self) -> None:
+        # Upload part bodies are wrapped with bandwidth limiting disabled, so it has to
+        # be enabled once the request is created (as s3transfer does for S3 uploads).
+        event_name = "request-created.omics"
+        self._client.meta.events.register_first(
+            event_name,
+            signal_not_transferring,
+            unique_id="omics-upload-not-transferring",
+        )
+        self._client.meta.events.register_last(
+            event_name,
+            signal_transferring,
+            unique_id="omics-upload-transferring",
+        )
+
     def _get_next_transfer_id(self) -> int:
-        self._current_transfer_id += 1
-        return self._current_transfer_id - 1
+        return next(self._transfer_id_counter)
 
     def __enter__(self) -> Any:
         """Return self when entering a 'with' block."""
@@ -588,12 +799,134 @@ class TransferManager:
             self._submission_executor.shutdown()
             self._request_executor.shutdown()
             self._io_executor.shutdown()
+            self._reference_metadata_cache.clear()
+            self._read_set_metadata_cache.clear()
+
+
+def _get_download_output_manager_cls(
+    client_fileobj: Union[IO[Any], str], osutil: OSUtils
+) -> Type["DownloadOutputManager"]:
+    """Select the output manager class for a download target.
+
+    The first compatible class is used, in order: file name, seekable file object,
+    then non-seekable (write-only) file object.
+    """
+    from s3transfer.download import (
+        DownloadNonSeekableOutputManager,
+        DownloadSeekableOutputManager,
+    )
+
+    from omics.transfer.download import OmicsDownloadFilenameOutputManager
+
+    # File names are by far the most common target and always use the first class.
+    if isinstance(client_fileobj, str):
+        return OmicsDownloadFilenameOutputManager
+    output_manager_classes: Tuple[Type["DownloadOutputManager"], ...] = (
+        OmicsDownloadFilenameOutputManager,
+        DownloadSeekableOutputManager,
+        DownloadNonSeekableOutputManager,
+    )
+    for download_manager_cls in output_manager_classes:
+        if download_manager_cls.is_compatible(client_fileobj, osutil):
+            return download_manager_cls
+    raise ValueError(f"The client_fileobj (type: {type(client_fileobj)}) is not supported")
+
+
+def _wait_for_transfers(transfer_futures: List[OmicsTransferFuture]) -> None:
+    """Wait for transfers in the order they finish, cancelling the rest on the first failure."""
+    finished: "queue.SimpleQueue[OmicsTransferFuture]" = queue.SimpleQueue()
+    for future in transfer_futures:
+        future.add_done_callback(finished.put, future)
+
+    pending = set(transfer_futures)
+    try:
+        while pending:
+            future = finished.get()
+            if future in pending:
+                pending.remove(future)
+                future.result()
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+
+
+def _build_download_specs(
+    directory: str,
+    file_name: str,
+    file_type: str,
+    server_filenames: Iterable[str],
+    file_name_enum: Type[ExtendedEnum],
+    add_source_counter: bool = False,
+) -> List[Tuple[Any, str]]:
+    """Build the server file and local path of every file in a reference or read set.
+
+    The files are returned in the order their server file names are declared in the enum,
+    with the data files before the index.
+
+    Args:
+        directory: Local directory to place the files.
+
+        file_name: The name of the reference or read set.
+
+        file_type: The type of the files on the server.
+
+        server_filenames: The names of the files as they are stored on the server.
+
+        file_name_enum: The enum type of the server file names.
+
+        add_source_counter: Whether to add `_1` or `_2` to the source file names.
+    """
+    # The base name and file type are the same for every file, so prepare them once.
+    base_name = _get_local_base_name(file_name)
+    file_type = file_type.upper()
+    suffix = FILE_TYPE_SUFFIX_MAP.get(file_type)
+    index_suffix = FILE_TYPE_INDEX_SUFFIX_MAP.get(file_type)
+    directory_prefix = _get_directory_prefix(directory)
+
+    # Files are visited in the order of the enum, so that submission order does not
+    # depend on the order of the service response and the data files, which are much
+    # larger than the index, start first.
+    members = list(file_name_enum)
+    server_filename_enums = sorted(
+        (file_name_enum.from_object(filename) for filename in server_filenames),
+        key=members.index,
+    )
+    download_specs = []
+    for server_filename in server_filename_enums:
+        file_path = directory_prefix + _format_prepared_local_filename(
+            base_name,
+            server_filename,
+            file_type,
+            suffix,
+            index_suffix,
+            add_source_counter,
+        )
+        download_specs.append((server_filename, file_path))
+    return download_specs
+
+
+def _get_directory_prefix(directory: str) -> str:
+    """Return the prefix to concatenate with a file name to form a path in a directory.
+
+    The prefix is ``os.path.join(directory, "")``. Adding a file name without separators
+    or a drive (such as a name from ``_get_valid_filename``) gives the same result as
+    ``os.path.join(directory, name)``, including for a Windows drive-relative
+    directory such as ``"C:"``, which gets no separator.
+    """
+    return os.path.join(directory, "")
 
 
 def _create_directory(directory: str) -> None:
     """Create a directory if one does not exist yet."""
-    if not os.path.isdir(directory):
-        os.makedirs(directory, exist_ok=True)
+    # The directory usually exists, and makedirs would stat the parent and attempt a
+    # mkdir before checking it, so look for it with a single stat first.
+    try:
+        if stat.S_ISDIR(os.stat(directory).st_mode):
+            return
+    except FileNotFoundError:
+        pass
+    os.makedirs(directory, exist_ok=True)
 
 
 def _format_local_filename(
@@ -617,48 +950,87 @@ def _format_local_filename(
     # File type should be uppercase, though we support passing in lower case.
     file_type = file_type.upper()
 
+    return _format_prepared_local_filename(
+        _get_local_base_name(file_name),
+        server_filename,
+        file_type,
+        FILE_TYPE_SUFFIX_MAP.get(file_type),
+        FILE_TYPE_INDEX_SUFFIX_MAP.get(file_type),
+        add_source_counter,
+    )
+
+
+def _get_local_base_name(file_name: str) -> str:
+    """Derive the base of a local file name (without extension) from the name in the manifest."""
     # Remove extensions that that users may have added to the name since we will be adding our own.
     file_name = _remove_file_extensions(file_name)
 
     # Remove or replace characters that are not valid for a file name.
-    file_name = _get_valid_filename(file_name)
+    return _get_valid_filename(file_name)
+
 
+def _format_prepared_local_filename(
+    base_name: str,
+    server_filename: Union[ReferenceFileName, ReadSetFileName],
+    file_type: str,
+    suffix: Optional[str],
+    index_suffix: Optional[str],
+    add_source_counter: bool = False,
+) -> str:
+    """Format the name of the local file from values prepared by the caller.
+
+    Args:
+        base_name: The base of the local file name, as returned by `_get_local_base_name`.
+
+        server_filename: The name of the file as it is stored on the server (ex: index, source, source1, source2).
+
+        file_type: The upper case type of the file on the server.
+
+        suffix: The data file suffix (ex: `.bam`) for the file type, or None if unknown.
+
+        index_suffix: The index file suffix (ex: `.bam.bai`) for the file type, or None if unknown.
+
+        add_source_counter: Whether to add `_1` or `_2` to the name before the extension.
+    """
     # Handle index file names first.
     if server_filename in [ReferenceFileName.INDEX, ReadSetFileName.INDEX]:
-        if file_type in FILE_TYPE_INDEX_EXTENSION_MAP:
-            return f"{file_name}.{FILE_TYPE_INDEX_EXTENSION_MAP[file_type]}"
+        if index_suffix is not None:
+            return base_name + index_suffix
         else:
-            print(
-                f"Unexpected file type: {file_type}.  Applying extension 'index' to the index file."
+            logger.warning(
+                "Unexpected file type: %s.  Applying extension 'index' to the index file.",
+                file_type,
             )
-            return f"{file_name}.index"
+            return base_name + ".index"
 
     # Apply a counter to the file if necessary.
     if server_filename == ReadSetFileName.SOURCE2:
-        file_name = file_name + "_2"
+        base_name = base_name + "_2"
     elif add_source_counter:
-        file_name = file_name + "_1"
+        base_name = base_name + "_1"
 
     # Apply the extension.
-    if file_type in FILE_TYPE_EXTENSION_MAP:
-        file_name = f"{file_name}.{FILE_TYPE_EXTENSION_MAP[file_type]}"
-    else:
-        print(f"Unexpected file type: {file_type}.  No extension applied.")
+    if suffix is not None:
+        return base_name + suffix
 
-    return file_name
+    logger.warning("Unexpected file type: %s.  No extension applied.", file_type)
+    return base_name
 
 
 def _remove_file_extensions(file_name: str) -> str:
     """Remove Omics file extensions from the file name."""
+    lower_file_name = file_name.lower()
     # First remove gzip extension (if present).
-    if file_name[-3:].lower() == ".gz":
+    if lower_file_name.endswith(".gz"):
         file_name = file_name[:-3]
+        lower_file_name = lower_file_name[:-3]
 
-    # Iterate the possible omics file types.
-    for ext in FILE_TYPE_EXTENSION_MAP.values():
-        ext = "." + ext  # We're interested in the extension with the period
-        if file_name[(-len(ext)) :].lower() == ext:
-            file_name = file_name[: (-len(ext))]
+    # Then remove each omics file type extension in turn (if present), so that a name such
+    # as "sample.cram.bam" loses both.
+    for ext in STRIPPED_FILE_EXTENSIONS:
+        if lower_file_name.endswith(ext):
+            file_name = file_name[: -len(ext)]
+            lower_file_name = lower_file_name[: -len(ext)]
 
     return file_name
 
@@ -675,7 +1047,10 @@ def _get_valid_filename(name: str):
     'johns_portrait_in_2004.jpg'
     """
     s = str(name).strip().replace(" ", "_")
-    s = re.sub(r"(?u)[^-\w.]", "", s)
-    if s in {"", ".", ".."}:
+    if s.isascii():
+        s = s.translate(INVALID_ASCII_FILENAME_CHARACTERS_TABLE)
+    else:
+        s = INVALID_FILENAME_CHARACTERS.sub("", s)
+    if s in RESERVED_FILENAMES:
         raise ValueError(f"Could not derive file name from '{s}'")
     return s
@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class MetadataCache(Generic[V]):
+    """A thread-safe, size-bounded LRU cache with an optional time to live.
+
+    Loads are single-flight: concurrent ``get_or_load`` calls for a missing key make
+    one request and share its result.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """Create the cache.
+
+        Args:
+            maxsize: The maximum number of entries. The least recently used entry is
+                evicted when it is exceeded.
+
+            ttl: The number of seconds an entry stays valid, or None to keep entries
+                until they are evicted.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # Values and their expiry times (or None), least recently used first.
+        self._entries: "OrderedDict[Hashable, Tuple[V, Optional[float]]]" = OrderedDict()
+        # Locks for keys that are being loaded. Each is removed once its load finishes.
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether the cache has a valid entry for the key, without marking it as used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry[1])
+
+    def __len__(self) -> int:
+        """Return the number of entries, including any that have expired but not been evicted."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for the key, or None if it is missing or expired."""
+        with self._lock:
+            return self._get(key)
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Cache a value, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._put(key, value)
+
+    def get_or_load(self, key: Hashable, load: Callable[[], V]) -> V:
+        """Return the cached value for the key, calling ``load`` to fill it if needed.
+
+        Only one thread calls ``load`` for a key at a time; the others wait for it and
+        reuse its result. A failed load is not cached.
+        """
+        with self._lock:
+            value = self._get(key)
+            if value is not None:
+                return value
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            try:
+                value = self.get(key)
+                if value is None:
+                    value = load()
+                    self.put(key, value)
+                return value
+            finally:
+                # Threads already waiting on this lock still hold a reference to it, and
+                # will find the value in the cache.
+                with self._lock:
+                    if self._load_locks.get(key) is load_lock:
+                        del self._load_locks[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._load_locks.clear()
+
+    def _get(self, key: Hashable) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if self._is_expired(expires_at):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _is_expired(expires_at: Optional[float]) -> bool:
+        return expires_at is not None and time.monotonic() >= expires_at
+
+    def _put(self, key: Hashable, value: V) -> None:
+        expires_at = None if self._ttl is None else time.monotonic() + self._ttl
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
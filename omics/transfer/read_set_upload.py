@@ -3,7 +3,7 @@ from typing import IO, Any, Awaitable, Dict, List, Optional
 
 from mypy_boto3_omics.client import OmicsClient
 from s3transfer.bandwidth import BandwidthLimiter
-from s3transfer.futures import BoundedExecutor, TransferFuture
+from s3transfer.futures import IN_MEMORY_UPLOAD_TAG, BoundedExecutor, TransferFuture
 from s3transfer.tasks import SubmissionTask, Task
 from s3transfer.upload import (
     UploadFilenameInputManager,
@@ -15,12 +15,31 @@ from s3transfer.utils import ChunksizeAdjuster, OSUtils
 
 from omics.common.omics_file_types import ReadSetFileName
 from omics.transfer import ReadSetUpload
+from omics.transfer.config import TransferConfig
 
 logger = logging.getLogger(__name__)
 
 MIB_BYTES = 1024 * 1024
 UPLOAD_PART_SIZE_BYTES = MIB_BYTES * 100  # 100MiB
 
+UPLOAD_PART_OPERATION_NAME = "UploadReadSetPart"
+
+
+def signal_not_transferring(request: Any, operation_name: str, **kwargs: Any) -> None:
+    """Pause bandwidth limiting and progress callbacks while a part request is created."""
+    if operation_name == UPLOAD_PART_OPERATION_NAME and hasattr(
+        request.body, "signal_not_transferring"
+    ):
+        request.body.signal_not_transferring()
+
+
+def signal_transferring(request: Any, operation_name: str, **kwargs: Any) -> None:
+    """Resume bandwidth limiting and progress callbacks once a part request is sent."""
+    if operation_name == UPLOAD_PART_OPERATION_NAME and hasattr(
+        request.body, "signal_transferring"
+    ):
+        request.body.signal_transferring()
+
 
 class CreateMultipartReadSetUploadTask(Task):
     """Task to initiate a multipart upload."""
@@ -36,26 +55,32 @@ class CreateMultipartReadSetUploadTask(Task):
         :param create_args: The arguments to pass to the multipart upload request
         :returns: The upload ID.
         """
-        args = {
+        # Validate before creating the upload so that nothing needs to be cleaned up.
+        if create_args.reference_arn == "" and create_args.file_type not in ["FASTQ", "UBAM"]:
+            raise AttributeError("Unlinked read set file types must specify a reference ARN")
+
+        args: Dict[str, Any] = {
             "sequenceStoreId": create_args.store_id,
             "sourceFileType": create_args.file_type,
-            "subjectId": create_args.subject_id,
-            "sampleId": create_args.sample_id,
-            "generatedFrom": create_args.generated_from,
-            "referenceArn": create_args.reference_arn,
             "name": create_args.name,
-            "description": create_args.description,
-            "tags": create_args.tags,
         }
-        response = client.create_multipart_read_set_upload(
-            # Filter out non-required null args to make validation happy
-            **{k: v for k, v in args.items() if v is not None}
-        )
+        # Only include optional args that are set to make validation happy
+        if create_args.subject_id is not None:
+            args["subjectId"] = create_args.subject_id
+        if create_args.sample_id is not None:
+            args["sampleId"] = create_args.sample_id
+        if create_args.generated_from is not None:
+            args["generatedFrom"] = create_args.generated_from
+        if create_args.reference_arn is not None:
+            args["referenceArn"] = create_args.reference_arn
+        if create_args.description is not None:
+            args["description"] = create_args.description
+        if create_args.tags is not None:
+            args["tags"] = create_args.tags
+
+        response = client.create_multipart_read_set_upload(**args)
         upload_id = response["uploadId"]
 
-        if (args["referenceArn"] == "") and (args["sourceFileType"] not in ["FASTQ", "UBAM"]):
-            raise AttributeError("Unlinked read set file types must specify a reference ARN")
-
         # Add a cleanup if the multipart upload fails at any point.
         self._transfer_coordinator.add_failure_cleanup(
             client.abort_multipart_read_set_upload,
@@ -158,6 +183,7 @@ class ReadSetUploadSubmissionTask(SubmissionTask):
         transfer_future: TransferFuture,
         paired_transfer_future: Optional[TransferFuture],
         bandwidth_limiter: Optional[BandwidthLimiter] = None,
+        config: Optional[TransferConfig] = None,
     ) -> None:
         """Submit the task.
 
@@ -171,8 +197,10 @@ class ReadSetUploadSubmissionTask(SubmissionTask):
             with the transfer request that tasks are to be submitted for
         :param bandwidth_limiter: The bandwidth limiter to use for
             limiting bandwidth during the upload.
+        :param config: The transfer config associated with the transfer manager
         """
         upload_args: ReadSetUpload = transfer_future.meta.call_args  # type: ignore
+        part_size = UPLOAD_PART_SIZE_BYTES if config is None else config.multipart_chunksize
 
         # Submit the request to create a multipart upload.
         create_multipart_future = self._transfer_coordinator.submit(
@@ -200,6 +228,7 @@ class ReadSetUploadSubmissionTask(SubmissionTask):
                     create_multipart_future=create_multipart_future,
                     part_source=ReadSetFileName.SOURCE1 if i == 0 else ReadSetFileName.SOURCE2,
                     bandwidth_limiter=bandwidth_limiter,
+                    part_size=part_size,
                 )
             )
 
@@ -229,6 +258,7 @@ class ReadSetUploadSubmissionTask(SubmissionTask):
         create_multipart_future: Awaitable[str],
         part_source: ReadSetFileName,
         bandwidth_limiter: BandwidthLimiter = None,
+        part_size: int = UPLOAD_PART_SIZE_BYTES,
     ):
         """Submit the upload futures for each task.
 
@@ -242,6 +272,8 @@ class ReadSetUploadSubmissionTask(SubmissionTask):
         :param part_source: The type of reads being uploaded
         :param bandwidth_limiter: The bandwidth limiter to use for
             limiting bandwidth during the upload.
+        :param part_size: The requested size of each part, before adjusting it to
+            the service limits
         """
         # Get the relevant transfer data out of the transfer future
         upload_args: ReadSetUpload = transfer_future.meta.call_args  # type: ignore
@@ -253,14 +285,17 @@ class ReadSetUploadSubmissionTask(SubmissionTask):
         if transfer_future.meta.size is None:
             upload_input_manager.provide_transfer_size(transfer_future)
 
-        # Get any tags that need to be associated to the submitted task for upload the data
-        # TODO: Support tag semaphores to control memory usage
-        #       https://github.com/boto/s3transfer/blob/f225103e69f2e2b61e8933ad816519229afaf088/s3transfer/manager.py#L244-L251
-        # upload_part_tag = IN_MEMORY_UPLOAD_TAG if upload_input_manager.stores_body_in_memory("upload_part") else None
+        # Parts that are read into memory are tagged so that the request executor
+        # limits how many of them can be pending at a time.
+        upload_part_tag = (
+            IN_MEMORY_UPLOAD_TAG
+            if upload_input_manager.stores_body_in_memory("upload_part")
+            else None
+        )
 
         part_futures = []
         adjuster = ChunksizeAdjuster()
-        chunksize = adjuster.adjust_chunksize(UPLOAD_PART_SIZE_BYTES, transfer_future.meta.size)
+        chunksize = adjuster.adjust_chunksize(part_size, transfer_future.meta.size)
         part_iterator = upload_input_manager.yield_upload_part_bodies(transfer_future, chunksize)
 
         for part_number, fileobj in part_iterator:
@@ -278,6 +313,7 @@ class ReadSetUploadSubmissionTask(SubmissionTask):
                         },
                         pending_main_kwargs={"upload_id": create_multipart_future},
                     ),
+                    tag=upload_part_tag,
                 )
             )
 
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
+import functools
 import re
+from typing import Tuple
 
 from omics.common.omics_file_types import (
     OMICS_URI_TYPE_DEFAULT_FILENAME_MAP,
-    OMICS_URI_TYPE_FILENAME_MAP,
+    OMICS_URI_TYPE_FILENAME_SET,
     OmicsFileType,
 )
 
@@ -19,6 +21,15 @@ class OmicsUri:
     ex: omics://429915189008.storage.us-east-1.amazonaws.com/1981413158/reference/5346184667/source
     """
 
+    __slots__ = (
+        "account_id",
+        "region",
+        "store_id",
+        "resource_type",
+        "resource_id",
+        "file_name",
+    )
+
     URI_REGEX = r"omics://(\d{10,12})\.storage\.([a-z]{2}-[a-z-]{4,}-\d+)\.amazonaws\.com/(\d{10,36})/(readSet|reference)/(\d{10,36})(/(source[12]?|index))?$"
 
     def __init__(self, omics_uri):
@@ -27,22 +38,51 @@ class OmicsUri:
         Args:
             omics_uri: String representing an omics URI.
         """
-        uri_match = re.match(self.URI_REGEX, omics_uri, re.IGNORECASE)
-        if not uri_match:
-            raise ValueError(f"Invalid URI format: {omics_uri}")
-        self.account_id = uri_match.group(1)
-        self.region = uri_match.group(2).lower()
-        self.store_id = uri_match.group(3)
-        self.resource_type = uri_match.group(4).upper()
-        self.resource_id = uri_match.group(5)
-        file_name = (uri_match.group(7) or "").upper()
-        file_type = OmicsFileType(self.resource_type)
-        if not file_name:
-            self.file_name = OMICS_URI_TYPE_DEFAULT_FILENAME_MAP[file_type].value
-        elif file_name in OMICS_URI_TYPE_FILENAME_MAP[file_type].list():
-            self.file_name = file_name
-        else:
-            raise ValueError(f"Invalid URI file: {file_name}")
+        (
+            self.account_id,
+            self.region,
+            self.store_id,
+            self.resource_type,
+            self.resource_id,
+            self.file_name,
+        ) = _parse_uri(omics_uri)
+
+
+# Compiled once at import rather than looked up in the re cache for every URI.
+_URI_RE = re.compile(OmicsUri.URI_REGEX, re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_uri(omics_uri: str) -> Tuple[str, str, str, str, str, str]:
+    """Parse and validate an Omics URI.
+
+    Results are cached since the same URIs are often parsed repeatedly (for example,
+    the source files of a read set). Invalid URIs raise and are not cached.
+
+    Args:
+        omics_uri: String representing an omics URI.
+
+    Returns:
+        The account ID, region, store ID, resource type, resource ID and file name.
+    """
+    uri_match = _URI_RE.match(omics_uri)
+    if not uri_match:
+        raise ValueError(f"Invalid URI format: {omics_uri}")
+    resource_type = uri_match.group(4).upper()
+    file_name = (uri_match.group(7) or "").upper()
+    file_type = OmicsFileType(resource_type)
+    if not file_name:
+        file_name = OMICS_URI_TYPE_DEFAULT_FILENAME_MAP[file_type].value
+    elif file_name not in OMICS_URI_TYPE_FILENAME_SET[file_type]:
+        raise ValueError(f"Invalid URI file: {file_name}")
+    return (
+        uri_match.group(1),
+        uri_match.group(2).lower(),
+        uri_match.group(3),
+        resource_type,
+        uri_match.group(5),
+        file_name,
+    )
 
 
 class OmicsUriParser:
@@ -1,3 +1,5 @@
+import shutil
+import tempfile
 import unittest
 
 import botocore.session
@@ -31,8 +33,14 @@ TEST_CONSTANTS_REFERENCE_STORE = {
 
 
 class StubbedClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Loading the service model dominates client creation, so the tests of a class
+        # share a session (which caches it) while each test still gets its own client.
+        cls.session = botocore.session.get_session()
+
     def setUp(self):
-        self.session = botocore.session.get_session()
         self.region = "us-west-2"
         self.client = self.session.create_client(
             "omics",
@@ -59,6 +67,26 @@ class StubbedClientTest(unittest.TestCase):
         self.stubber.activate()
 
 
+class TempDirMixin:
+    """Give each test its own directory inside a temporary directory shared by the test class."""
+
+    _class_tempdir: str
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._class_tempdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._class_tempdir, ignore_errors=True)
+        super().tearDownClass()
+
+    def make_test_tempdir(self) -> str:
+        # A unique name, so that rerunning a failed test does not reuse its directory.
+        return tempfile.mkdtemp(prefix=self._testMethodName + "-", dir=self._class_tempdir)
+
+
 class BaseTaskTest(StubbedClientTest):
     def setUp(self):
         super().setUp()
@@ -1,4 +1,3 @@
-import copy
 import datetime
 import gzip
 import io
@@ -43,7 +42,7 @@ def add_get_read_set_responses(stubber, file="SOURCE1"):
             stream = BytesIO(TEST_CONSTANTS["content"][i : i + TEST_CONSTANTS["part_size"]])
         stubber.add_response(
             "get_read_set",
-            service_response=copy.deepcopy({"payload": stream}),
+            service_response={"payload": stream},
             expected_params={
                 "sequenceStoreId": TEST_CONSTANTS["sequence_store_id"],
                 "id": TEST_CONSTANTS["read_set_id"],
@@ -86,7 +85,7 @@ def add_gzipped_get_read_set_response(stubber, file="SOURCE1"):
     stream.seek(0)
     stubber.add_response(
         "get_read_set",
-        service_response=copy.deepcopy({"payload": stream}),
+        service_response={"payload": stream},
         expected_params={
             "sequenceStoreId": TEST_CONSTANTS["sequence_store_id"],
             "id": TEST_CONSTANTS["read_set_id"],
@@ -140,7 +139,7 @@ def add_get_reference_responses(stubber, file="SOURCE"):
             )
         stubber.add_response(
             "get_reference",
-            service_response=copy.deepcopy({"payload": stream}),
+            service_response={"payload": stream},
             expected_params={
                 "referenceStoreId": TEST_CONSTANTS_REFERENCE_STORE["reference_store_id"],
                 "id": TEST_CONSTANTS_REFERENCE_STORE["reference_id"],
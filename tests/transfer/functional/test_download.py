@@ -1,7 +1,4 @@
-import copy
-import glob
 import os
-import tempfile
 from io import BytesIO
 
 from botocore.exceptions import ClientError
@@ -17,6 +14,7 @@ from tests.transfer import (
     RecordingSubscriber,
     StreamWithError,
     StubbedClientTest,
+    TempDirMixin,
 )
 from tests.transfer.functional import (
     add_get_read_set_metadata_response,
@@ -24,35 +22,40 @@ from tests.transfer.functional import (
 )
 
 
-class BaseDownloadTest(StubbedClientTest):
+class BaseDownloadTest(TempDirMixin, StubbedClientTest):
     def setUp(self):
         super().setUp()
         self.config = TransferConfig(max_request_concurrency=1)
         self._manager = TransferManager(self.client, self.config)
-        self.tempdir = tempfile.mkdtemp()
+        self.tempdir = self.make_test_tempdir()
         self.filename = os.path.join(self.tempdir, "test_file")
 
     @property
     def manager(self):
         return self._manager
 
+    def list_download_files(self):
+        """List the downloaded file and any temporary files left next to it."""
+        name = os.path.basename(self.filename)
+        return sorted(
+            entry.name for entry in os.scandir(self.tempdir) if entry.name.startswith(name)
+        )
+
     def add_n_retryable_download_file_responses(
         self, omics_file_type: OmicsFileType, n: int, num_reads: int = 0
     ):
-        content = (
-            TEST_CONSTANTS["content"]
-            if omics_file_type.READSET
-            else TEST_CONSTANTS_REFERENCE_STORE["content"]
-        )
-        method = "get_read_set" if omics_file_type.READSET else "get_reference"
+        if omics_file_type == OmicsFileType.READSET:
+            content = TEST_CONSTANTS["content"]
+            method = "get_read_set"
+        else:
+            content = TEST_CONSTANTS_REFERENCE_STORE["content"]
+            method = "get_reference"
 
         for _ in range(n):
             self.stubber.add_response(
                 method=method,
                 service_response={
-                    "payload": StreamWithError(
-                        copy.deepcopy(BytesIO(content)), SOCKET_ERROR, num_reads
-                    )
+                    "payload": StreamWithError(BytesIO(content), SOCKET_ERROR, num_reads)
                 },
             )
 
@@ -69,9 +72,8 @@ class BaseDownloadTest(StubbedClientTest):
         )
         future.result()
 
-        self.assertTrue(os.path.exists(self.filename))
-        possible_matches = glob.glob("'%s*'" % self.filename + os.extsep)
-        self.assertEqual(possible_matches, [])
+        # The temporary file should have been renamed to the final file.
+        self.assertEqual(self.list_download_files(), [os.path.basename(self.filename)])
 
     def test_download_file_for_fileobj(self):
         add_get_read_set_metadata_response(self.stubber)
@@ -124,9 +126,7 @@ class BaseDownloadTest(StubbedClientTest):
             future.result()
 
         # Make sure the actual file and the temporary do not exist
-        # by globbing for the file and any of its extensions
-        possible_matches = glob.glob("'%s*'" % self.filename)
-        self.assertEqual(possible_matches, [])
+        self.assertEqual(self.list_download_files(), [])
 
     def test_download_file_with_nonexistent_directory(self):
         add_get_read_set_metadata_response(self.stubber)
@@ -151,20 +151,21 @@ class BaseDownloadTest(StubbedClientTest):
         # as normal after the retry.
         add_get_read_set_responses(self.stubber)
 
+        # The retry path does not depend on the output, so download into memory.
+        bytes_io = BytesIO()
         future = self.manager._download_file(
             OmicsFileType.READSET,
             TEST_CONSTANTS["sequence_store_id"],
             TEST_CONSTANTS["read_set_id"],
             TEST_CONSTANTS["file"],
-            self.filename,
+            bytes_io,
         )
         future.result()
 
         # The retry should have been consumed and the process should have
         # continued using the successful responses.
         self.stubber.assert_no_pending_responses()
-        with open(self.filename, "rb") as f:
-            self.assertEqual(TEST_CONSTANTS["content"], f.read())
+        self.assertEqual(TEST_CONSTANTS["content"], bytes_io.getvalue())
 
     def test_download_read_set_retry_failure(self):
         add_get_read_set_metadata_response(self.stubber)
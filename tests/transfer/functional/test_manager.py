@@ -1,9 +1,9 @@
 import io
+import json
 import os
-import tempfile
 from concurrent.futures import CancelledError
-from unittest import skip
 
+from botocore.awsrequest import AWSResponse
 from s3transfer.exceptions import FatalError
 
 from omics.common.omics_file_types import (
@@ -17,7 +17,9 @@ from omics.transfer.read_set_upload import MIB_BYTES
 from tests.transfer import (
     TEST_CONSTANTS,
     TEST_CONSTANTS_REFERENCE_STORE,
+    RecordingSubscriber,
     StubbedClientTest,
+    TempDirMixin,
 )
 from tests.transfer.functional import (
     add_complete_upload_response,
@@ -32,14 +34,33 @@ from tests.transfer.functional import (
 )
 
 
+class NonSeekableWriter(io.RawIOBase):
+    """A writable stream that cannot seek, like a pipe or socket."""
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def write(self, data):
+        return self._buffer.write(data)
+
+    def getvalue(self):
+        return self._buffer.getvalue()
+
+
 class ArbitraryException(Exception):
     pass
 
 
-class SingleThreadedTransferManagerTest(StubbedClientTest):
+class SingleThreadedTransferManagerTest(TempDirMixin, StubbedClientTest):
     def setUp(self):
         super().setUp()
-        self.tempdir = tempfile.mkdtemp()
+        self.tempdir = self.make_test_tempdir()
         self.filename = os.path.join(self.tempdir, "test_file")
         self._manager = TransferManager(
             self.client,
@@ -60,15 +81,11 @@ class SingleThreadedTransferManagerTest(StubbedClientTest):
     def add_default_stubber_responses(self, file_type: OmicsFileType):
         if file_type == OmicsFileType.READSET:
             add_get_read_set_metadata_response(self.stubber, files=["source1", "source2"])
-            add_get_read_set_metadata_response(self.stubber, files=["source1"])
             add_get_read_set_responses(self.stubber, file="SOURCE1")
-            add_get_read_set_metadata_response(self.stubber, files=["source2"])
             add_get_read_set_responses(self.stubber, file="SOURCE2")
         elif file_type == OmicsFileType.REFERENCE:
             add_get_reference_metadata_response(self.stubber, files=["source", "index"])
-            add_get_reference_metadata_response(self.stubber, files=["source"])
             add_get_reference_responses(self.stubber, file="SOURCE")
-            add_get_reference_metadata_response(self.stubber, files=["index"])
             add_get_reference_responses(self.stubber, file="INDEX")
 
     def test_download_read_set(self):
@@ -95,7 +112,6 @@ class SingleThreadedTransferManagerTest(StubbedClientTest):
             self.assertEqual(TEST_CONSTANTS["content"], f.read())
 
     def test_gzipped_read_set_filename_extension(self):
-        add_gzipped_get_read_set_metadata_response(self.stubber, files=["source1"])
         add_gzipped_get_read_set_metadata_response(self.stubber, files=["source1"])
         add_gzipped_get_read_set_response(self.stubber, file="SOURCE1")
 
@@ -147,6 +163,113 @@ class SingleThreadedTransferManagerTest(StubbedClientTest):
         possible_matches = os.listdir(new_directory)
         self.assertEqual(len(possible_matches), 2)
 
+    def test_download_read_set_file_reuses_cached_metadata(self):
+        new_directory = f"{self.tempdir}/test-default"
+        self._manager = TransferManager(
+            self.client,
+            TransferConfig(use_threads=False, directory=new_directory),
+        )
+        # Metadata is fetched once and shared by both files and their submission tasks.
+        add_get_read_set_metadata_response(self.stubber, files=["source1", "source2"])
+        add_get_read_set_responses(self.stubber, file="SOURCE1")
+        add_get_read_set_responses(self.stubber, file="SOURCE2")
+
+        for file in [ReadSetFileName.SOURCE1, ReadSetFileName.SOURCE2]:
+            self.manager.download_read_set_file(
+                TEST_CONSTANTS["sequence_store_id"],
+                TEST_CONSTANTS["read_set_id"],
+                file,
+            )
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(
+            set(os.listdir(new_directory)),
+            {"test-read-set_1.fastq", "test-read-set_2.fastq"},
+        )
+
+    def test_download_read_set_with_provided_metadata(self):
+        add_get_read_set_metadata_response(self.stubber, files=["source1", "source2"])
+        metadata = self.client.get_read_set_metadata(
+            sequenceStoreId=TEST_CONSTANTS["sequence_store_id"], id=TEST_CONSTANTS["read_set_id"]
+        )
+        add_get_read_set_responses(self.stubber, file="SOURCE1")
+        add_get_read_set_responses(self.stubber, file="SOURCE2")
+
+        self.manager.download_read_set(
+            TEST_CONSTANTS["sequence_store_id"],
+            TEST_CONSTANTS["read_set_id"],
+            self.tempdir,
+            metadata=metadata,
+        )
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(
+            set(os.listdir(self.tempdir)),
+            {"test-read-set_1.fastq", "test-read-set_2.fastq"},
+        )
+
+    def test_download_read_set_file_objects_share_metadata(self):
+        self._manager = TransferManager(self.client, TransferConfig(use_threads=False))
+        # The first submission task fetches the metadata and the second reuses it.
+        add_get_read_set_metadata_response(self.stubber, files=["source1", "source2"])
+        add_get_read_set_responses(self.stubber, file="SOURCE1")
+        add_get_read_set_responses(self.stubber, file="SOURCE2")
+
+        for file in [ReadSetFileName.SOURCE1, ReadSetFileName.SOURCE2]:
+            self.manager.download_read_set_file(
+                TEST_CONSTANTS["sequence_store_id"],
+                TEST_CONSTANTS["read_set_id"],
+                file,
+                io.BytesIO(),
+            )
+
+        self.stubber.assert_no_pending_responses()
+
+    def test_download_read_set_file_to_non_seekable_stream(self):
+        add_get_read_set_metadata_response(self.stubber)
+        add_get_read_set_responses(self.stubber)
+
+        stream = NonSeekableWriter()
+        self.manager.download_read_set_file(
+            TEST_CONSTANTS["sequence_store_id"],
+            TEST_CONSTANTS["read_set_id"],
+            ReadSetFileName.SOURCE1,
+            stream,
+        )
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(stream.getvalue(), TEST_CONSTANTS["content"])
+
+    def test_prefetch_read_set_metadata(self):
+        add_get_read_set_metadata_response(self.stubber)
+
+        key = (TEST_CONSTANTS["sequence_store_id"], TEST_CONSTANTS["read_set_id"])
+        self.manager.prefetch_read_set_metadata([key, key])
+
+        self.stubber.assert_no_pending_responses()
+        self.assertIn(key, self.manager._read_set_metadata_cache)
+
+    def test_prefetch_reference_metadata(self):
+        add_get_reference_metadata_response(self.stubber)
+        add_get_reference_responses(self.stubber)
+
+        self.manager.prefetch_reference_metadata(
+            [
+                (
+                    TEST_CONSTANTS_REFERENCE_STORE["reference_store_id"],
+                    TEST_CONSTANTS_REFERENCE_STORE["reference_id"],
+                )
+            ]
+        )
+        self.manager.download_reference_file(
+            TEST_CONSTANTS_REFERENCE_STORE["reference_store_id"],
+            TEST_CONSTANTS_REFERENCE_STORE["reference_id"],
+            ReferenceFileName.SOURCE,
+            self.filename,
+        )
+
+        self.stubber.assert_no_pending_responses()
+
     def test_download_reference(self):
         self.add_default_stubber_responses(OmicsFileType.REFERENCE)
 
@@ -169,6 +292,52 @@ class SingleThreadedTransferManagerTest(StubbedClientTest):
         with open(os.path.join(self.tempdir, "test-reference-file.fasta.fai"), "rb") as f:
             self.assertEqual(TEST_CONSTANTS_REFERENCE_STORE["content"], f.read())
 
+    def test_download_reference_file_reuses_cached_metadata(self):
+        new_directory = f"{self.tempdir}/test-default"
+        self._manager = TransferManager(
+            self.client,
+            TransferConfig(use_threads=False, directory=new_directory),
+        )
+        # Metadata is fetched once and shared by both files and their submission tasks.
+        add_get_reference_metadata_response(self.stubber, files=["source", "index"])
+        add_get_reference_responses(self.stubber, file="SOURCE")
+        add_get_reference_responses(self.stubber, file="INDEX")
+
+        for file in [ReferenceFileName.SOURCE, ReferenceFileName.INDEX]:
+            self.manager.download_reference_file(
+                TEST_CONSTANTS_REFERENCE_STORE["reference_store_id"],
+                TEST_CONSTANTS_REFERENCE_STORE["reference_id"],
+                file,
+            )
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(
+            set(os.listdir(new_directory)),
+            {"test-reference-file.fasta", "test-reference-file.fasta.fai"},
+        )
+
+    def test_download_reference_with_provided_metadata(self):
+        add_get_reference_metadata_response(self.stubber, files=["source", "index"])
+        metadata = self.client.get_reference_metadata(
+            referenceStoreId=TEST_CONSTANTS_REFERENCE_STORE["reference_store_id"],
+            id=TEST_CONSTANTS_REFERENCE_STORE["reference_id"],
+        )
+        add_get_reference_responses(self.stubber, file="SOURCE")
+        add_get_reference_responses(self.stubber, file="INDEX")
+
+        self.manager.download_reference(
+            TEST_CONSTANTS_REFERENCE_STORE["reference_store_id"],
+            TEST_CONSTANTS_REFERENCE_STORE["reference_id"],
+            self.tempdir,
+            metadata=metadata,
+        )
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(
+            set(os.listdir(self.tempdir)),
+            {"test-reference-file.fasta", "test-reference-file.fasta.fai"},
+        )
+
     def test_download_reference_without_wait(self):
         self.add_default_stubber_responses(OmicsFileType.REFERENCE)
 
@@ -223,10 +392,10 @@ class SingleThreadedTransferManagerTest(StubbedClientTest):
         self.assertEqual(read_set_id, TEST_CONSTANTS["read_set_id"])
 
 
-class MultiThreadedTransferManagerTest(StubbedClientTest):
+class MultiThreadedTransferManagerTest(TempDirMixin, StubbedClientTest):
     def setUp(self):
         super().setUp()
-        self.tempdir = tempfile.mkdtemp()
+        self.tempdir = self.make_test_tempdir()
         self.filename = os.path.join(self.tempdir, "test_file")
         self._manager = TransferManager(
             self.client,
@@ -251,6 +420,59 @@ class MultiThreadedTransferManagerTest(StubbedClientTest):
         with open(self.filename, "rb") as f:
             self.assertEqual(TEST_CONSTANTS["content"], f.read())
 
+    def test_download_read_set_file_invokes_done_subscribers(self):
+        add_get_read_set_metadata_response(self.stubber)
+        add_get_read_set_responses(self.stubber)
+        subscriber = RecordingSubscriber()
+
+        self.manager.download_read_set_file(
+            TEST_CONSTANTS["sequence_store_id"],
+            TEST_CONSTANTS["read_set_id"],
+            ReadSetFileName.SOURCE1,
+            self.filename,
+            subscribers=[subscriber],
+        )
+
+        self.assertEqual(len(subscriber.on_done_calls), 1)
+
+    def test_download_read_set_file_with_unbounded_submission_queue(self):
+        add_get_read_set_metadata_response(self.stubber)
+        add_get_read_set_responses(self.stubber)
+
+        manager = TransferManager(
+            self.client,
+            TransferConfig(
+                max_request_concurrency=1,
+                max_submission_concurrency=1,
+                max_submission_queue_size=None,
+            ),
+        )
+        with manager:
+            manager.download_read_set_file(
+                TEST_CONSTANTS["sequence_store_id"],
+                TEST_CONSTANTS["read_set_id"],
+                ReadSetFileName.SOURCE1,
+                self.filename,
+            )
+
+        with open(self.filename, "rb") as f:
+            self.assertEqual(TEST_CONSTANTS["content"], f.read())
+
+    def test_download_read_set_file_to_non_seekable_stream(self):
+        add_get_read_set_metadata_response(self.stubber)
+        add_get_read_set_responses(self.stubber)
+
+        stream = NonSeekableWriter()
+        with self.manager:
+            self.manager.download_read_set_file(
+                TEST_CONSTANTS["sequence_store_id"],
+                TEST_CONSTANTS["read_set_id"],
+                ReadSetFileName.SOURCE1,
+                stream,
+            )
+
+        self.assertEqual(stream.getvalue(), TEST_CONSTANTS["content"])
+
     def test_download_reference_file(self):
         add_get_reference_metadata_response(self.stubber)
         add_get_reference_responses(self.stubber)
@@ -266,7 +488,6 @@ class MultiThreadedTransferManagerTest(StubbedClientTest):
             self.assertEqual(TEST_CONSTANTS_REFERENCE_STORE["content"], f.read())
 
     def test_download_read_set_file_to_config_dir(self):
-        add_get_read_set_metadata_response(self.stubber)
         add_get_read_set_metadata_response(self.stubber)
         add_get_read_set_responses(self.stubber)
 
@@ -295,13 +516,13 @@ class MultiThreadedTransferManagerTest(StubbedClientTest):
         with open(expected_filename, "rb") as f:
             self.assertEqual(TEST_CONSTANTS["content"], f.read())
 
-    @skip("Concurrency in futures leads to out of order stubs and therefore to assertion failures")
     def test_error_in_context_manager_cancels_incomplete_transfers(self):
-        num_transfers = 100
+        num_transfers = 8
         futures = []
         ref_exception_msg = "arbitrary exception"
+        # The transfers share one metadata request.
+        add_get_read_set_metadata_response(self.stubber)
         for _ in range(num_transfers):
-            add_get_read_set_metadata_response(self.stubber)
             add_get_read_set_responses(self.stubber)
 
         try:
@@ -323,13 +544,13 @@ class MultiThreadedTransferManagerTest(StubbedClientTest):
                 for future in futures:
                     future.result()
 
-    @skip("Concurrency in futures leads to out of order stubs and therefore to assertion failures")
     def test_control_c_in_context_manager_cancels_incomplete_transfers(self):
-        num_transfers = 100
+        num_transfers = 8
         futures = []
 
+        # The transfers share one metadata request.
+        add_get_read_set_metadata_response(self.stubber)
         for _ in range(num_transfers):
-            add_get_read_set_metadata_response(self.stubber)
             add_get_read_set_responses(self.stubber)
 
         try:
@@ -366,3 +587,66 @@ class MultiThreadedTransferManagerTest(StubbedClientTest):
         )
 
         self.assertEqual(read_set_id, TEST_CONSTANTS["read_set_id"])
+
+
+class RawResponse:
+    """The raw body of an ``AWSResponse``."""
+
+    def __init__(self, content: bytes):
+        self._content = content
+
+    def stream(self, **kwargs):
+        yield self._content
+
+
+class UploadRequestHandlersTest(StubbedClientTest):
+    """Uploads whose requests are created, so that request-created handlers run.
+
+    The Stubber returns responses before requests are created, so these tests answer
+    them when they are sent instead.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.stubber.deactivate()
+        self.sent_part_bodies = []
+        self.client.meta.events.register("before-send.omics", self.send)
+        self.manager = TransferManager(self.client, TransferConfig(use_threads=False))
+
+    def send(self, request, **kwargs):
+        if "/part?" in request.url:
+            # Read the part body as sending it would.
+            self.sent_part_bodies.append(request.body.read())
+            response = {"checksum": TEST_CONSTANTS["checksum"]}
+        elif request.url.endswith("/complete"):
+            response = {"readSetId": TEST_CONSTANTS["read_set_id"]}
+        else:
+            response = {
+                "uploadId": TEST_CONSTANTS["upload_id"],
+                "sequenceStoreId": TEST_CONSTANTS["sequence_store_id"],
+                "sourceFileType": "FASTQ",
+                "subjectId": "subjectId",
+                "sampleId": "sampleId",
+                "name": "name",
+                "creationTime": "2024-01-01T00:00:00Z",
+            }
+        return AWSResponse(request.url, 200, {}, RawResponse(json.dumps(response).encode()))
+
+    def test_upload_read_set_reports_progress(self):
+        content = b"some file content"
+        subscriber = RecordingSubscriber()
+
+        with self.manager:
+            read_set_id = self.manager.upload_read_set(
+                io.BytesIO(content),
+                TEST_CONSTANTS["sequence_store_id"],
+                "FASTQ",
+                "name",
+                "subjectId",
+                "sampleId",
+                subscribers=[subscriber],
+            )
+
+        self.assertEqual(read_set_id, TEST_CONSTANTS["read_set_id"])
+        self.assertEqual(self.sent_part_bodies, [content])
+        self.assertEqual(subscriber.calculate_bytes_seen(), len(content))
@@ -11,3 +11,38 @@ class TestTransferConfig(unittest.TestCase):
     def test_exception_on_negative_attr_value(self):
         with self.assertRaises(ValueError):
             TransferConfig(max_request_concurrency=-10)
+
+    def test_unbounded_io_queue_size(self):
+        self.assertIsNone(TransferConfig(max_io_queue_size=None).max_io_queue_size)
+
+    def test_unbounded_submission_queue_size(self):
+        config = TransferConfig(max_submission_queue_size=None)
+        self.assertIsNone(config.max_submission_queue_size)
+
+    def test_zero_retry_delays_are_allowed(self):
+        for delay in [0, 0.0]:
+            config = TransferConfig(download_retry_base_delay=delay, download_retry_max_delay=delay)
+            self.assertEqual(config.download_retry_base_delay, 0)
+            self.assertEqual(config.download_retry_max_delay, 0)
+
+    def test_exception_on_negative_retry_delay(self):
+        for delay in [-1, -1.0, float("nan")]:
+            with self.assertRaises(ValueError):
+                TransferConfig(download_retry_base_delay=delay)
+            with self.assertRaises(ValueError):
+                TransferConfig(download_retry_max_delay=delay)
+
+    def test_metadata_cache_ttl(self):
+        self.assertIsNone(TransferConfig(metadata_cache_ttl=None).metadata_cache_ttl)
+        self.assertEqual(TransferConfig(metadata_cache_ttl=1).metadata_cache_ttl, 1)
+        for ttl in [0, 0.0, -1.0]:
+            with self.assertRaises(ValueError):
+                TransferConfig(metadata_cache_ttl=ttl)
+
+    def test_exception_on_zero_metadata_cache_size(self):
+        with self.assertRaises(ValueError):
+            TransferConfig(metadata_cache_size=0)
+
+    def test_release_page_cache_is_off_by_default(self):
+        self.assertFalse(TransferConfig().release_page_cache)
+        self.assertTrue(TransferConfig(release_page_cache=True).release_page_cache)
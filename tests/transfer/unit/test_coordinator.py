@@ -0,0 +1,38 @@
+import unittest
+
+from s3transfer.futures import TransferCoordinator
+
+from omics.transfer.coordinator import ShardedCoordinatorController
+
+
+class TestShardedCoordinatorController(unittest.TestCase):
+    def setUp(self):
+        self.controller = ShardedCoordinatorController(num_shards=4)
+        self.coordinators = [TransferCoordinator(transfer_id=i) for i in range(10)]
+        for coordinator in self.coordinators:
+            self.controller.add_transfer_coordinator(coordinator)
+
+    def test_tracks_coordinators_across_shards(self):
+        self.assertEqual(self.controller.tracked_transfer_coordinators, set(self.coordinators))
+
+    def test_remove_transfer_coordinator(self):
+        self.controller.remove_transfer_coordinator(self.coordinators[5])
+        self.assertNotIn(self.coordinators[5], self.controller.tracked_transfer_coordinators)
+        self.assertEqual(len(self.controller.tracked_transfer_coordinators), 9)
+
+    def test_cancel_cancels_all_shards(self):
+        self.controller.cancel("cancelled")
+        for coordinator in self.coordinators:
+            self.assertEqual(coordinator.status, "cancelled")
+
+    def test_wait_returns_when_all_done(self):
+        for coordinator in self.coordinators:
+            coordinator.set_result(None)
+            coordinator.announce_done()
+        self.controller.wait()
+
+    def test_wait_ignores_failed_transfers(self):
+        for coordinator in self.coordinators:
+            coordinator.set_exception(ValueError("failed"))
+            coordinator.announce_done()
+        self.controller.wait()
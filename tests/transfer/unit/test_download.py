@@ -2,13 +2,16 @@ import copy
 import os.path
 import shutil
 import tempfile
+import time
+import unittest
 from io import BytesIO
 from typing import IO, Any, Tuple, Union
+from unittest import mock
 
 from botocore.stub import ANY
 from s3transfer.download import DownloadSeekableOutputManager
 from s3transfer.exceptions import RetriesExceededError
-from s3transfer.futures import BoundedExecutor, TransferMeta
+from s3transfer.futures import BoundedExecutor, TransferCoordinator, TransferMeta
 from s3transfer.utils import OSUtils
 
 from omics.common.omics_file_types import OmicsFileType
@@ -18,6 +21,8 @@ from omics.transfer.download import (
     DownloadSubmissionTask,
     GetFileTask,
     OmicsDownloadFilenameOutputManager,
+    SequentialWriteFile,
+    _wait_for_retry,
 )
 from tests.transfer import (
     TEST_CONSTANTS,
@@ -195,6 +200,24 @@ class TestDownloadSubmissionTask(BaseSubmissionTaskTest):
         assert len(self.executor.submissions) == TEST_CONSTANTS["total_parts"]
         assert self.osutil.get_file_size(self.filename) == len(TEST_CONSTANTS["content"])
 
+    def test_submit_with_provided_metadata_files(self):
+        self.wrap_executor_in_recorder()
+        add_get_read_set_responses(self.stubber)
+
+        self.submission_main_kwargs["metadata_files"] = {
+            TEST_CONSTANTS["file"].lower(): {
+                "contentLength": len(TEST_CONSTANTS["content"]),
+                "partSize": TEST_CONSTANTS["part_size"],
+                "totalParts": TEST_CONSTANTS["total_parts"],
+            }
+        }
+        self.submission_task = self.get_task(
+            DownloadSubmissionTask, main_kwargs=self.submission_main_kwargs
+        )
+        self.wait_and_assert_completed_successfully(self.submission_task)
+        assert len(self.executor.submissions) == TEST_CONSTANTS["total_parts"]
+        assert self.osutil.get_file_size(self.filename) == len(TEST_CONSTANTS["content"])
+
     def test_submit_with_seekable_file_object(self):
         self.wrap_executor_in_recorder()
         add_get_read_set_metadata_response(self.stubber)
@@ -358,6 +381,49 @@ class TestGetFileTask(BaseTaskTest):
             self.transfer_coordinator.result()
         self.stubber.assert_no_pending_responses()
 
+    def test_retries_back_off_with_jitter(self):
+        for _ in range(2):
+            self.stubber.add_response(
+                "get_read_set",
+                service_response={"payload": StreamWithError(self.stream, SOCKET_ERROR)},
+                expected_params=get_expected_read_set_api_call_params(),
+            )
+        self.stubber.add_response(
+            "get_read_set",
+            service_response={"payload": self.stream},
+            expected_params=get_expected_read_set_api_call_params(),
+        )
+        task = self.get_download_task(retry_base_delay=1.0, retry_max_delay=1.5)
+        with mock.patch("omics.transfer.download._wait_for_retry") as wait_for_retry:
+            task()
+
+        self.stubber.assert_no_pending_responses()
+        delays = [call.args[1] for call in wait_for_retry.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0 <= delays[0] <= 1.0)
+        self.assertTrue(0 <= delays[1] <= 1.5)
+        self.assert_io_writes([(0, TEST_CONSTANTS["content"])])
+
+    def test_retries_do_not_wait_after_last_attempt(self):
+        for _ in range(self.max_attempts):
+            self.stubber.add_response(
+                "get_read_set",
+                service_response={"payload": StreamWithError(self.stream, SOCKET_ERROR)},
+                expected_params=get_expected_read_set_api_call_params(),
+            )
+
+        task = self.get_download_task()
+        with mock.patch("omics.transfer.download._wait_for_retry") as wait_for_retry:
+            task()
+
+        self.assertEqual(wait_for_retry.call_count, self.max_attempts - 1)
+
+    def test_wait_for_retry_returns_when_cancelled(self):
+        self.transfer_coordinator.cancel()
+        start = time.monotonic()
+        _wait_for_retry(self.transfer_coordinator, 10)
+        self.assertLess(time.monotonic() - start, 1)
+
     def test_retries_in_middle_of_streaming(self):
         # After the first read a retryable error will be thrown
         self.stubber.add_response(
@@ -404,3 +470,50 @@ class TestGetFileTask(BaseTaskTest):
         # should have been canceled before trying to add the contents to the
         # io queue.
         self.assert_io_writes([])
+
+
+class TestSequentialWriteFile(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tempdir, "test_file")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "requires posix_fadvise")
+    def test_writes_at_offsets(self):
+        f = SequentialWriteFile(self.filename, mode="wb")
+        f.seek(4)
+        f.write(b"tent")
+        f.seek(0)
+        f.write(b"con")
+        f.write(b" ")
+        f.close()
+
+        with open(self.filename, "rb") as f:
+            self.assertEqual(f.read(), b"con tent")
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "requires posix_fadvise")
+    def test_releases_pages_once_on_close(self):
+        with mock.patch("omics.transfer.download._fadvise") as fadvise:
+            f = SequentialWriteFile(self.filename, mode="wb")
+            f.write(b"content")
+            f.write(b"content")
+            fadvise.assert_called_once_with(mock.ANY, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            f.close()
+            fadvise.assert_called_with(mock.ANY, 0, 0, os.POSIX_FADV_DONTNEED)
+            self.assertEqual(fadvise.call_count, 2)
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "requires posix_fadvise")
+    def test_output_manager_releases_pages_only_if_configured(self):
+        for release_page_cache in [False, True]:
+            download_manager = OmicsDownloadFilenameOutputManager(
+                OSUtils(),
+                TransferCoordinator(),
+                BoundedExecutor(1, 1),
+                release_page_cache=release_page_cache,
+            )
+            f = download_manager._get_fileobj_from_filename(self.filename)
+            self.assertEqual(isinstance(f, SequentialWriteFile), release_page_cache)
+            f.close()
@@ -0,0 +1,28 @@
+import threading
+import unittest
+
+from s3transfer.futures import IN_MEMORY_DOWNLOAD_TAG, NonThreadedExecutor
+
+from omics.transfer.executor import UnboundedExecutor
+
+
+class TestUnboundedExecutor(unittest.TestCase):
+    def test_submit_does_not_block_on_pending_tasks(self):
+        executor = UnboundedExecutor(max_num_threads=1)
+        release = threading.Event()
+        futures = [executor.submit(release.wait) for _ in range(5)]
+        self.assertFalse(any(future.done() for future in futures))
+        release.set()
+        for future in futures:
+            future.result()
+        executor.shutdown()
+
+    def test_submit_with_non_threaded_executor(self):
+        executor = UnboundedExecutor(max_num_threads=1, executor_cls=NonThreadedExecutor)
+        future = executor.submit(lambda: "done")
+        self.assertEqual(future.result(), "done")
+
+    def test_submit_with_tag_fails(self):
+        executor = UnboundedExecutor(max_num_threads=1, executor_cls=NonThreadedExecutor)
+        with self.assertRaises(ValueError):
+            executor.submit(lambda: "done", tag=IN_MEMORY_DOWNLOAD_TAG)
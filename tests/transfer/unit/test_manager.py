@@ -1,16 +1,40 @@
 import io
+import ntpath
 import os
+import subprocess
+import sys
 import tempfile
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-from s3transfer.futures import TransferFuture
+from s3transfer.constants import MB
+from s3transfer.futures import TransferCoordinator, TransferFuture
 from s3transfer.utils import OSUtils
 
-from omics.common.omics_file_types import ReadSetFileName, ReferenceFileName
-from omics.transfer.manager import TransferManager, _format_local_filename
+from omics.common.omics_file_types import (
+    OmicsFileType,
+    ReadSetFileName,
+    ReferenceFileName,
+)
+from omics.transfer import OmicsTransferFuture
+from omics.transfer.config import TransferConfig
+from omics.transfer.manager import (
+    TransferManager,
+    _build_download_specs,
+    _create_directory,
+    _format_local_filename,
+    _get_directory_prefix,
+    _get_valid_filename,
+    _remove_file_extensions,
+    _wait_for_transfers,
+)
 from tests.transfer import (
     TEST_CONSTANTS,
     TEST_CONSTANTS_REFERENCE_STORE,
     StubbedClientTest,
+    TempDirMixin,
 )
 from tests.transfer.functional import (
     add_abort_upload_response,
@@ -24,10 +48,10 @@ from tests.transfer.functional import (
 )
 
 
-class TestTransferManager(StubbedClientTest):
+class TestTransferManager(TempDirMixin, StubbedClientTest):
     def setUp(self):
         super().setUp()
-        self.tempdir = tempfile.mkdtemp()
+        self.tempdir = self.make_test_tempdir()
         self.filename = os.path.join(self.tempdir, "test_file")
         self.osutils = OSUtils()
         self.transfer_manager = TransferManager(self.client)
@@ -88,6 +112,19 @@ class TestTransferManager(StubbedClientTest):
                     f,
                 )
 
+    def test_download_unsupported_fileobj_fails_without_tracking_transfer(self):
+        with self.assertRaises(ValueError):
+            self.transfer_manager._download_file(
+                OmicsFileType.READSET,
+                TEST_CONSTANTS["sequence_store_id"],
+                TEST_CONSTANTS["read_set_id"],
+                TEST_CONSTANTS["file"],
+                12345,
+            )
+        self.assertEqual(
+            self.transfer_manager._coordinator_controller.tracked_transfer_coordinators, set()
+        )
+
     def test_format_local_filename_with_lowercase_file_type(self):
         filename = _format_local_filename("test-filename", ReferenceFileName.INDEX, "fasta")
         self.assertEqual(filename, "test-filename.fasta.fai")
@@ -122,9 +159,15 @@ class TestTransferManager(StubbedClientTest):
 
     # This shouldn't happen, but we create a file with a `.index` extension anyway
     def test_format_fastq_index_local_filename(self):
-        filename = _format_local_filename("test-filename", ReadSetFileName.INDEX, "FASTQ")
+        with self.assertLogs("omics.transfer.manager", level="WARNING"):
+            filename = _format_local_filename("test-filename", ReadSetFileName.INDEX, "FASTQ")
         self.assertEqual(filename, "test-filename.index")
 
+    def test_format_unknown_file_type_local_filename(self):
+        with self.assertLogs("omics.transfer.manager", level="WARNING"):
+            filename = _format_local_filename("test-filename", ReadSetFileName.SOURCE1, "VCF")
+        self.assertEqual(filename, "test-filename")
+
     # UBAM should not have an .index file but we include this for consistency.
     def test_format_ubam_index_local_filename(self):
         filename = _format_local_filename("test-filename", ReadSetFileName.INDEX, "UBAM")
@@ -155,6 +198,148 @@ class TestTransferManager(StubbedClientTest):
         )
         self.assertEqual(filename, "test-filename_1.cram")
 
+    def test_get_valid_filename(self):
+        self.assertEqual(
+            _get_valid_filename(" john's portrait in 2004.jpg "), "johns_portrait_in_2004.jpg"
+        )
+        self.assertEqual(_get_valid_filename("a!@#$%^&*()+=[]{}|;:,<>?/~`b-c_d.e"), "ab-c_d.e")
+        self.assertEqual(_get_valid_filename("Æды nå!"), "Æды_nå")
+        with self.assertRaises(ValueError):
+            _get_valid_filename("!..")
+
+    def test_remove_file_extensions(self):
+        self.assertEqual(_remove_file_extensions("sample.fastq.gz"), "sample")
+        self.assertEqual(_remove_file_extensions("sample.BAM"), "sample")
+        self.assertEqual(_remove_file_extensions("sample.gz"), "sample")
+        self.assertEqual(_remove_file_extensions("sample.v2.txt"), "sample.v2.txt")
+        self.assertEqual(_remove_file_extensions("bam"), "bam")
+        self.assertEqual(_remove_file_extensions("x.cram.bam"), "x")
+        self.assertEqual(_remove_file_extensions("x.BAM.cram.gz"), "x")
+
+    def test_build_download_specs(self):
+        specs = _build_download_specs(
+            "out", "test-read-set", "BAM", ["source2", "source1", "index"], ReadSetFileName, True
+        )
+        self.assertEqual(
+            specs,
+            [
+                (ReadSetFileName.SOURCE1, os.path.join("out", "test-read-set_1.bam")),
+                (ReadSetFileName.SOURCE2, os.path.join("out", "test-read-set_2.bam")),
+                (ReadSetFileName.INDEX, os.path.join("out", "test-read-set.bam.bai")),
+            ],
+        )
+
+    def test_get_directory_prefix(self):
+        for directory in ["out", "out" + os.sep, os.path.join("a", "b"), "", "."]:
+            self.assertEqual(
+                _get_directory_prefix(directory) + "name.bam", os.path.join(directory, "name.bam")
+            )
+
+    def test_get_directory_prefix_with_windows_paths(self):
+        with mock.patch("os.path", ntpath):
+            for directory in ["C:", "C:\\", "C:\\out", "C:/out/", "out", ""]:
+                self.assertEqual(
+                    _get_directory_prefix(directory) + "name.bam",
+                    ntpath.join(directory, "name.bam"),
+                )
+            self.assertEqual(_get_directory_prefix("C:"), "C:")
+
+    def test_create_directory(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            directory = os.path.join(tempdir, "a", "b")
+            _create_directory(directory)
+            self.assertTrue(os.path.isdir(directory))
+            with mock.patch("os.makedirs") as makedirs:
+                _create_directory(directory)
+            makedirs.assert_not_called()
+
+    def test_concurrent_metadata_requests_are_shared(self):
+        client = mock.Mock()
+        release = threading.Event()
+
+        def get_read_set_metadata(**kwargs):
+            release.wait()
+            return {"files": {}}
+
+        client.get_read_set_metadata.side_effect = get_read_set_metadata
+        transfer_manager = TransferManager(client)
+        key = (TEST_CONSTANTS["sequence_store_id"], TEST_CONSTANTS["read_set_id"])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(transfer_manager._get_read_set_metadata, *key) for _ in range(4)
+            ]
+            release.set()
+            results = [future.result() for future in futures]
+
+        client.get_read_set_metadata.assert_called_once()
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_upload_does_not_import_download_modules(self):
+        # Run in a new interpreter, since this test module imports the download modules.
+        script = textwrap.dedent(
+            """
+            import io
+            import sys
+            from unittest import mock
+
+            from omics.transfer.manager import TransferManager
+
+            client = mock.Mock()
+            client.create_multipart_read_set_upload.return_value = {"uploadId": "upload-id"}
+            client.upload_read_set_part.return_value = {"checksum": "checksum"}
+            client.complete_multipart_read_set_upload.return_value = {"readSetId": "read-set-id"}
+            with TransferManager(client) as manager:
+                manager.upload_read_set(
+                    io.BytesIO(b"content"), "store-id", "FASTQ", "name", "subject", "sample"
+                )
+            print(" ".join(m for m in ("s3transfer.download", "omics.transfer.download") if m in sys.modules))
+            """
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_get_metadata_files_with_invalid_file_type(self):
+        client = mock.Mock()
+        transfer_manager = TransferManager(client)
+        with self.assertRaises(AttributeError):
+            transfer_manager._get_metadata_files(
+                "UNKNOWN", TEST_CONSTANTS["sequence_store_id"], TEST_CONSTANTS["read_set_id"]
+            )
+        client.get_read_set_metadata.assert_not_called()
+        client.get_reference_metadata.assert_not_called()
+
+    def test_wait_for_transfers_cancels_pending_on_failure(self):
+        running = OmicsTransferFuture(coordinator=TransferCoordinator())
+        running._coordinator.set_status_to_running()
+        queued = OmicsTransferFuture(coordinator=TransferCoordinator())
+        failed = OmicsTransferFuture(coordinator=TransferCoordinator())
+        failed._coordinator.set_exception(ValueError("failed"))
+        failed._coordinator.announce_done()
+
+        with self.assertRaises(ValueError):
+            _wait_for_transfers([running, queued, failed])
+        self.assertEqual(running._coordinator.status, "cancelled")
+        self.assertEqual(queued._coordinator.status, "cancelled")
+
+    def test_wait_for_transfers_waits_for_all(self):
+        futures = [OmicsTransferFuture(coordinator=TransferCoordinator()) for _ in range(3)]
+        for future in futures:
+            future._coordinator.set_status_to_running()
+
+        def finish():
+            for future in reversed(futures):
+                future._coordinator.set_result(None)
+                future._coordinator.announce_done()
+
+        thread = threading.Thread(target=finish)
+        thread.start()
+        _wait_for_transfers(futures)
+        thread.join()
+        self.assertTrue(all(future.done() for future in futures))
+
     def test_upload_single_file(self):
         add_create_upload_response(self.stubber)
         add_upload_part_response(self.stubber, 1, ReadSetFileName.SOURCE1)
@@ -176,6 +361,39 @@ class TestTransferManager(StubbedClientTest):
         self.assertEqual(read_set_id, TEST_CONSTANTS["read_set_id"])
         self.stubber.assert_no_pending_responses()
 
+    def test_upload_with_multipart_chunksize(self):
+        self.transfer_manager = TransferManager(
+            self.client, TransferConfig(use_threads=False, multipart_chunksize=5 * MB)
+        )
+        add_create_upload_response(self.stubber)
+        add_upload_part_response(self.stubber, 1, ReadSetFileName.SOURCE1)
+        add_upload_part_response(self.stubber, 2, ReadSetFileName.SOURCE1)
+        add_complete_upload_response(self.stubber)
+
+        read_set_id = self.run_simple_upload(io.BytesIO(b"0" * (6 * MB)))
+
+        self.assertEqual(read_set_id, TEST_CONSTANTS["read_set_id"])
+        self.stubber.assert_no_pending_responses()
+
+    def test_upload_with_one_in_memory_upload_chunk(self):
+        self.transfer_manager = TransferManager(
+            self.client,
+            TransferConfig(
+                max_request_concurrency=1,
+                multipart_chunksize=5 * MB,
+                max_in_memory_upload_chunks=1,
+            ),
+        )
+        add_create_upload_response(self.stubber)
+        add_upload_part_response(self.stubber, 1, ReadSetFileName.SOURCE1)
+        add_upload_part_response(self.stubber, 2, ReadSetFileName.SOURCE1)
+        add_complete_upload_response(self.stubber)
+
+        read_set_id = self.run_simple_upload(io.BytesIO(b"0" * (6 * MB)))
+
+        self.assertEqual(read_set_id, TEST_CONSTANTS["read_set_id"])
+        self.stubber.assert_no_pending_responses()
+
     def test_upload_bad_file_throws_exception(self):
         add_create_upload_response(self.stubber)
         add_abort_upload_response(self.stubber)
@@ -0,0 +1,90 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from omics.transfer.metadata_cache import MetadataCache
+
+
+class TestMetadataCache(unittest.TestCase):
+    def test_get_missing_key(self):
+        cache = MetadataCache(maxsize=2)
+        self.assertIsNone(cache.get("a"))
+        self.assertNotIn("a", cache)
+
+    def test_evicts_least_recently_used(self):
+        cache = MetadataCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        # Using "a" makes "b" the least recently used entry.
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_contains_does_not_mark_entry_as_used(self):
+        cache = MetadataCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertIn("a", cache)
+        cache.put("c", 3)
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+
+    @mock.patch("omics.transfer.metadata_cache.time.monotonic")
+    def test_contains_checks_ttl(self, monotonic):
+        monotonic.return_value = 100.0
+        cache = MetadataCache(maxsize=2, ttl=10.0)
+        cache.put("a", 1)
+        self.assertIn("a", cache)
+        monotonic.return_value = 110.0
+        self.assertNotIn("a", cache)
+
+    @mock.patch("omics.transfer.metadata_cache.time.monotonic")
+    def test_entries_expire_after_ttl(self, monotonic):
+        monotonic.return_value = 100.0
+        cache = MetadataCache(maxsize=2, ttl=10.0)
+        cache.put("a", 1)
+        monotonic.return_value = 109.0
+        self.assertEqual(cache.get("a"), 1)
+        monotonic.return_value = 110.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_get_or_load_caches_result(self):
+        cache = MetadataCache(maxsize=2)
+        load = mock.Mock(return_value=1)
+        self.assertEqual(cache.get_or_load("a", load), 1)
+        self.assertEqual(cache.get_or_load("a", load), 1)
+        load.assert_called_once()
+        self.assertEqual(cache._load_locks, {})
+
+    def test_get_or_load_does_not_cache_failure(self):
+        cache = MetadataCache(maxsize=2)
+        with self.assertRaises(ValueError):
+            cache.get_or_load("a", mock.Mock(side_effect=ValueError("failed")))
+        self.assertNotIn("a", cache)
+        self.assertEqual(cache._load_locks, {})
+        self.assertEqual(cache.get_or_load("a", lambda: 1), 1)
+
+    def test_concurrent_loads_are_shared(self):
+        cache = MetadataCache(maxsize=2)
+        release = threading.Event()
+        load = mock.Mock(side_effect=lambda: release.wait() and "value")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(cache.get_or_load, "a", load) for _ in range(4)]
+            release.set()
+            results = [future.result() for future in futures]
+
+        load.assert_called_once()
+        self.assertEqual(results, ["value"] * 4)
+        self.assertEqual(cache._load_locks, {})
+
+    def test_clear(self):
+        cache = MetadataCache(maxsize=2)
+        cache.put("a", 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,99 @@
+import datetime
+import io
+import unittest
+from unittest import mock
+
+from s3transfer.bandwidth import BandwidthLimiter, LeakyBucket
+from s3transfer.futures import TransferCoordinator
+from s3transfer.utils import ReadFileChunk
+
+from omics.transfer import ReadSetUpload
+from omics.transfer.read_set_upload import (
+    UPLOAD_PART_OPERATION_NAME,
+    CreateMultipartReadSetUploadTask,
+    signal_not_transferring,
+    signal_transferring,
+)
+from tests.transfer import TEST_CONSTANTS, BaseTaskTest
+
+
+class TestSignalTransferring(unittest.TestCase):
+    def setUp(self):
+        limiter = BandwidthLimiter(LeakyBucket(1024))
+        self.stream = limiter.get_bandwith_limited_stream(
+            io.BytesIO(b"content"), TransferCoordinator(), enabled=False
+        )
+        self.request = mock.Mock(body=ReadFileChunk(self.stream, chunk_size=7, full_file_size=7))
+
+    def test_signal_transferring_enables_bandwidth_limiting(self):
+        signal_transferring(self.request, UPLOAD_PART_OPERATION_NAME)
+        self.assertTrue(self.stream._bandwidth_limiting_enabled)
+
+    def test_signal_not_transferring_disables_bandwidth_limiting(self):
+        signal_transferring(self.request, UPLOAD_PART_OPERATION_NAME)
+        signal_not_transferring(self.request, UPLOAD_PART_OPERATION_NAME)
+        self.assertFalse(self.stream._bandwidth_limiting_enabled)
+
+    def test_signal_ignores_other_operations(self):
+        signal_transferring(self.request, "GetReadSet")
+        self.assertFalse(self.stream._bandwidth_limiting_enabled)
+
+    def test_signal_ignores_body_without_signals(self):
+        request = mock.Mock(body=b"content")
+        signal_transferring(request, UPLOAD_PART_OPERATION_NAME)
+        signal_not_transferring(request, UPLOAD_PART_OPERATION_NAME)
+
+
+class TestCreateMultipartReadSetUploadTask(BaseTaskTest):
+    def get_create_args(self, file_type="FASTQ", reference_arn=None):
+        return ReadSetUpload(
+            store_id=TEST_CONSTANTS["sequence_store_id"],
+            file_type=file_type,
+            name="name",
+            subject_id="subjectId",
+            sample_id="sampleId",
+            fileobj=io.BytesIO(b"content"),
+            reference_arn=reference_arn,
+        )
+
+    def test_main_omits_unset_args(self):
+        self.stubber.add_response(
+            "create_multipart_read_set_upload",
+            service_response={
+                "uploadId": TEST_CONSTANTS["upload_id"],
+                "sequenceStoreId": TEST_CONSTANTS["sequence_store_id"],
+                "sourceFileType": "FASTQ",
+                "subjectId": "subjectId",
+                "sampleId": "sampleId",
+                "referenceArn": "referenceArn",
+                "name": "name",
+                "creationTime": datetime.datetime.now(),
+            },
+            expected_params={
+                "sequenceStoreId": TEST_CONSTANTS["sequence_store_id"],
+                "sourceFileType": "FASTQ",
+                "name": "name",
+                "subjectId": "subjectId",
+                "sampleId": "sampleId",
+            },
+        )
+        task = self.get_task(
+            CreateMultipartReadSetUploadTask,
+            main_kwargs={"client": self.client, "create_args": self.get_create_args()},
+        )
+
+        self.assertEqual(task(), TEST_CONSTANTS["upload_id"])
+        self.stubber.assert_no_pending_responses()
+
+    def test_main_validates_reference_arn_before_creating_upload(self):
+        task = self.get_task(
+            CreateMultipartReadSetUploadTask,
+            main_kwargs={
+                "client": self.client,
+                "create_args": self.get_create_args(file_type="BAM", reference_arn=""),
+            },
+        )
+
+        task()
+
+        self.assertIsInstance(self.transfer_coordinator.exception, AttributeError)
@@ -1,7 +1,10 @@
 import unittest
+from unittest import mock
+
+from s3transfer.futures import TransferCoordinator
 
 from omics.common.omics_file_types import ExtendedEnum, OmicsFileType
-from omics.transfer import FileDownload
+from omics.transfer import FileDownload, OmicsTransferFuture
 
 
 class NumberEnum(ExtendedEnum):
@@ -15,6 +18,13 @@ class TestExtendedEnum(unittest.TestCase):
         enum = NumberEnum.from_object("ONE")
         self.assertEqual(enum, NumberEnum.ONE)
 
+    def test_from_object_with_lowercase_string(self):
+        enum = NumberEnum.from_object("two")
+        self.assertEqual(enum, NumberEnum.TWO)
+
+    def test_from_object_with_enum(self):
+        self.assertIs(NumberEnum.from_object(NumberEnum.THREE), NumberEnum.THREE)
+
     def test_from_object_with_invalid_string(self):
         with self.assertRaises(AttributeError):
             NumberEnum.from_object("GOOGLE")
@@ -34,3 +44,45 @@ class TestFileTransfer(unittest.TestCase):
                 fileobj="mock-fileobj",
                 omics_file_type=OmicsFileType.READSET,
             )
+
+    def test_does_not_allow_unknown_attributes(self):
+        file_download = FileDownload(
+            store_id="mock-store-id",
+            file_set_id="mock-file-set-id",
+            filename="mock-filename",
+            fileobj="mock-fileobj",
+            omics_file_type=OmicsFileType.READSET,
+        )
+        with self.assertRaises(AttributeError):
+            file_download.unknown = "value"
+
+
+class TestOmicsTransferFuture(unittest.TestCase):
+    def setUp(self):
+        self.future = OmicsTransferFuture(coordinator=TransferCoordinator())
+        self.callback = mock.Mock()
+
+    def test_add_done_callback_runs_when_done(self):
+        self.future.add_done_callback(self.callback, "arg", key="value")
+        self.callback.assert_not_called()
+
+        self.future._coordinator.set_result(None)
+        self.future._coordinator.announce_done()
+        self.callback.assert_called_once_with("arg", key="value")
+
+    def test_add_done_callback_runs_immediately_if_already_done(self):
+        self.future._coordinator.set_result(None)
+        self.future._coordinator.announce_done()
+
+        self.future.add_done_callback(self.callback, "arg")
+        self.callback.assert_called_once_with("arg")
+
+    def test_add_done_callback_runs_once_if_done_before_callbacks_run(self):
+        # Simulate the transfer finishing between the callback being added and the
+        # coordinator running its callbacks.
+        self.future._coordinator.set_result(None)
+        self.future._coordinator._done_event.set()
+
+        self.future.add_done_callback(self.callback)
+        self.future._coordinator._run_done_callbacks()
+        self.callback.assert_called_once_with()
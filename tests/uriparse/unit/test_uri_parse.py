@@ -42,6 +42,23 @@ class UriParserTest(unittest.TestCase):
         assert res.region == "us-west-2"
         assert res.account_id == "123412341234"
 
+    def test_parser_repeat_uri_returns_new_object(self):
+        first = OmicsUriParser(VALID_READSET_URI).parse()
+        second = OmicsUriParser(VALID_READSET_URI).parse()
+        assert first is not second
+        for attr in OmicsUri.__slots__:
+            assert getattr(first, attr) == getattr(second, attr)
+
+    def test_parser_repeat_invalid_uri(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                OmicsUriParser(VALID_READSET_URI + "2").parse()
+
+    def test_uri_does_not_allow_unknown_attributes(self):
+        uri = OmicsUri(VALID_READSET_URI)
+        with self.assertRaises(AttributeError):
+            uri.unknown = "value"
+
     def test_invalid_uri_scheme(self):
         with self.assertRaises(ValueError):
             OmicsUri(